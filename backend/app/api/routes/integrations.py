@@ -1,5 +1,7 @@
 """API endpoints for integrations."""
 
+from datetime import UTC, datetime
+
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import RedirectResponse
 
@@ -58,8 +60,11 @@ async def sync_google_calendar():
 
 
 @router.get("/google-calendar/events", response_model=list[GoogleCalendarEvent])
-async def get_google_calendar_events():
-    """Get cached Google Calendar events."""
+async def get_google_calendar_events(
+    start: datetime | None = Query(None, description="Only events ending after this time"),
+    end: datetime | None = Query(None, description="Only events starting before this time"),
+):
+    """Get cached Google Calendar events, optionally limited to a time window."""
     status = google_calendar_service.get_status()
     if not status.is_authenticated:
         raise HTTPException(
@@ -67,7 +72,11 @@ async def get_google_calendar_events():
             detail="Google Calendar is not authenticated. Please connect your account first."
         )
 
-    return google_calendar_service.get_cached_events()
+    if start is None and end is None:
+        return google_calendar_service.get_cached_events()
+    return google_calendar_service.get_events_between(
+        start or datetime.min.replace(tzinfo=UTC), end or datetime.max.replace(tzinfo=UTC)
+    )
 
 
 @router.post("/google-calendar/disconnect")
@@ -8,7 +8,7 @@ from fastapi.responses import StreamingResponse
 from ...core.config import settings
 from ...core.logging import get_logger
 from ...services.project_cache_v2 import ProjectCacheService
-from ...services.rocketlane import RocketlaneClient
+from ...services.rocketlane import get_rocketlane_client
 from ...services.summarization import SummarizationService
 from ..dependencies import verify_api_keys, verify_llm_api_key
 
@@ -81,7 +81,7 @@ async def get_project(
 
         # If not in cache, fetch directly
         logger.info(f"Project {project_id} not in cache, fetching from API")
-        client = RocketlaneClient()
+        client = get_rocketlane_client()
         project = await client.get_project(project_id)
 
         # Add to cache for next time (trigger background refresh of all projects)
@@ -101,7 +101,7 @@ async def get_project_tasks(
     """Get tasks for a specific project"""
     try:
         logger.info(f"Fetching tasks for project {project_id} with status filter: {status}")
-        client = RocketlaneClient()
+        client = get_rocketlane_client()
         # Use the configured user ID to filter tasks
         user_id = settings.rocketlane_user_id if settings.rocketlane_user_id else None
         if user_id:
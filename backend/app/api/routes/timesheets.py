@@ -1,5 +1,6 @@
 """API routes for timesheet management."""
 
+import asyncio
 import base64
 import json
 from datetime import datetime, timedelta
@@ -11,7 +12,7 @@ from pydantic import BaseModel
 from ...core.config import settings
 from ...core.llm import get_llm_provider
 from ...services.project_cache_v2 import ProjectCacheService
-from ...services.rocketlane import RocketlaneClient
+from ...services.rocketlane import get_rocketlane_client
 from ...services.tasks_cache_v2 import tasks_cache_v2
 from ...services.time_entries_cache import time_entries_cache
 from ...services.time_entry_categories_cache import time_entry_categories_cache
@@ -199,7 +200,7 @@ async def create_time_entry(
         )
 
     try:
-        client = RocketlaneClient()
+        client = get_rocketlane_client()
         result = await client.create_time_entry_v2(
             date=entry.date,
             minutes=entry.minutes,
@@ -263,7 +264,7 @@ async def update_time_entry(
         )
 
     try:
-        client = RocketlaneClient()
+        client = get_rocketlane_client()
         result = await client.update_time_entry(
             entry_id=entry_id,
             date=entry.date,
@@ -314,7 +315,7 @@ async def delete_time_entry(
         )
 
     try:
-        client = RocketlaneClient()
+        client = get_rocketlane_client()
         await client.delete_time_entry(entry_id)
 
         # Invalidate cache if dates provided
@@ -501,7 +502,7 @@ async def transcribe_audio(request: TranscriptionRequest) -> dict[str, str]:
         audio_bytes = base64.b64decode(request.audio_data)
         
         # Get LLM provider (must be OpenAI for transcription)
-        llm_provider = get_llm_provider(settings)
+        llm_provider = get_llm_provider()
         
         # Check if provider supports transcription
         if not hasattr(llm_provider, "transcribe_audio"):
@@ -537,10 +538,13 @@ async def process_transcription(
         project_cache = ProjectCacheService()
         user_id = int(settings.rocketlane_user_id)
         
-        # Fetch all necessary data in parallel
+        # Projects first: a tasks cache miss reads the project cache this fills, so running
+        # them together could page /projects twice. Tasks and categories are independent.
         projects = await project_cache.get_user_projects(user_id)
-        tasks = await tasks_cache_v2.get_all_tasks()
-        categories = await time_entry_categories_cache.get_categories()
+        tasks, categories = await asyncio.gather(
+            tasks_cache_v2.get_all_tasks(),
+            time_entry_categories_cache.get_categories(),
+        )
         
         # Build context for LLM
         projects_context = []
@@ -611,7 +615,7 @@ User's spoken time entry for {request.date}:
 Parse this into time entries. Return ONLY the JSON array."""
 
         # Get LLM provider and process
-        llm_provider = get_llm_provider(settings)
+        llm_provider = get_llm_provider()
         response = await llm_provider.generate_completion(
             prompt=user_prompt,
             system_prompt=system_prompt,
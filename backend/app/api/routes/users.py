@@ -1,6 +1,6 @@
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from ...core.logging import get_logger
 from ...services.user_cache import UserCacheService
@@ -12,68 +12,69 @@ logger = get_logger(__name__)
 user_cache = UserCacheService()
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (which may list several tags) with etag"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
 @router.get("/", response_model=list[dict[str, Any]])
 async def get_users(
+    request: Request,
     force_refresh: bool = Query(False, description="Force refresh from API")
 ):
     """Get all available users from cache or Rocketlane API with pagination support"""
     try:
         logger.info(f"Fetching users (force_refresh={force_refresh})")
 
-        # Get users from cache or API
-        users = await user_cache.get_all_users(force_refresh=force_refresh)
-
-        # Transform and sort user data
-        formatted_users = [
-            {
-                "userId": user.get("userId"),
-                "emailId": user.get("email")
-                or user.get("emailId"),  # Handle both 'email' and 'emailId'
-                "firstName": user.get("firstName", ""),
-                "lastName": user.get("lastName", ""),
-                "fullName": f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
-                or user.get("email", "").split("@")[0],
-            }
-            for user in users
-            if user.get("userId") and (user.get("email") or user.get("emailId"))
-        ]
-
-        # Sort users alphabetically by full name
-        formatted_users.sort(key=lambda u: u["fullName"].lower())
-
+        # Get formatted users from cache or API (re-formatted only when the cache changes)
+        formatted_users = await user_cache.get_formatted_users(force_refresh=force_refresh)
         logger.info(f"Successfully formatted {len(formatted_users)} users")
-        return formatted_users
+
+        # Let repeat clients skip the body entirely
+        etag = user_cache.get_etag()
+        if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        # Serve the pre-serialized (and pre-compressed) payload for this cache generation
+        payload, encoding = user_cache.get_encoded(request.headers.get("accept-encoding", ""))
+        headers = {"Vary": "Accept-Encoding"}
+        if etag:
+            headers["ETag"] = etag
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=payload, media_type="application/json", headers=headers)
 
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error fetching users: {e}", exc_info=True)
+        logger.exception(f"Error fetching users: {e}")
+
+        # Serve the last successfully formatted list if we have one
+        if user_cache.last_good is not None:
+            logger.warning(
+                f"Serving {len(user_cache.last_good)} users from cache due to API error"
+            )
+            return user_cache.last_good
 
-        # Try to serve from stale cache if available
+        # Nothing formatted in this process yet (e.g. after a restart), try the cache file
         try:
-            users = await user_cache.get_all_users(force_refresh=False)
-            if users:
-                # Transform and sort user data
-                formatted_users = [
-                    {
-                        "userId": user.get("userId"),
-                        "emailId": user.get("email")
-                        or user.get("emailId"),
-                        "firstName": user.get("firstName", ""),
-                        "lastName": user.get("lastName", ""),
-                        "fullName": f"{user.get('firstName', '')} {user.get('lastName', '')}".strip()
-                        or user.get("email", "").split("@")[0],
-                    }
-                    for user in users
-                    if user.get("userId") and (user.get("email") or user.get("emailId"))
-                ]
-                formatted_users.sort(key=lambda u: u["fullName"].lower())
-
-                logger.warning(f"Serving {len(formatted_users)} users from cache due to API error")
-                return formatted_users
-        except:
-            pass
+            cached_users = user_cache.format_users(
+                await user_cache.get_all_users(force_refresh=False)
+            )
+        except Exception:
+            logger.exception("Error reading cached users")
+        else:
+            if cached_users:
+                logger.warning(f"Serving {len(cached_users)} users from cache due to API error")
+                return cached_users
 
         raise HTTPException(status_code=502, detail="Unable to fetch users. Please try again later.")
 
@@ -4,17 +4,25 @@ Generic caching framework for filesystem-based caching with TTL support.
 
 import asyncio
 import hashlib
-import json
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Callable, Generic, TypeVar
 
+import orjson
+
 from .logging import get_logger
 
 T = TypeVar("T")
 
+# Process-wide filesystem state so repeated cache construction and reads skip syscalls.
+# Several service instances can share one cache file, so this is keyed by path. A file
+# known to exist is opened directly; a missing one is re-checked with a stat on each read.
+_ensured_dirs: set[Path] = set()
+_cache_file_exists: dict[Path, bool] = {}
+
 class CacheConfig:
     """Configuration for cache behavior"""
     def __init__(
@@ -31,8 +39,10 @@ class CacheConfig:
         self.memory_cache_size = memory_cache_size
         self.enable_background_refresh = enable_background_refresh
 
-        # Ensure cache directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure cache directory exists (once per directory per process)
+        if self.cache_dir not in _ensured_dirs:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(self.cache_dir)
 
 
 class CacheEntry(Generic[T]):
@@ -79,8 +89,16 @@ class BaseCache(ABC, Generic[T]):
         self.logger = get_logger(f"cache.{cache_name}")
         self.cache_file = self.config.cache_dir / f"{cache_name}.json"
         self.lock_file = self.config.cache_dir / f"{cache_name}.lock"
-        self._memory_cache: dict[str, CacheEntry[T]] = {}
+        self._memory_cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
         self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def _remember(self, key: str, entry: CacheEntry[T]):
+        """Store entry in the memory cache, evicting least recently used entries"""
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.config.memory_cache_size:
+            self._memory_cache.popitem(last=False)
 
     def _get_cache_key(self, *args, **kwargs) -> str:
         """Generate a cache key from arguments"""
@@ -117,18 +135,25 @@ class BaseCache(ABC, Generic[T]):
 
     async def _read_cache_file(self) -> dict[str, CacheEntry[T]]:
         """Read cache from filesystem"""
-        if not self.cache_file.exists():
-            return {}
+        if not _cache_file_exists.get(self.cache_file):
+            # Another process (or a volume restore) may have created it since we last looked
+            if not self.cache_file.exists():
+                return {}
+            _cache_file_exists[self.cache_file] = True
 
         async with self._file_lock():
             try:
-                with open(self.cache_file) as f:
-                    data = json.load(f)
+                with open(self.cache_file, "rb") as f:
+                    data = orjson.loads(f.read())
                     return {
                         key: CacheEntry.from_dict(entry)
                         for key, entry in data.items()
                     }
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
+            except FileNotFoundError:
+                # Removed outside this process since we last looked
+                _cache_file_exists[self.cache_file] = False
+                return {}
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
                 self.logger.error(f"Error reading cache file: {e}")
                 return {}
 
@@ -142,17 +167,29 @@ class BaseCache(ABC, Generic[T]):
             try:
                 # Write to temp file first, then rename (atomic operation)
                 temp_file = self.cache_file.with_suffix(".tmp")
-                with open(temp_file, "w") as f:
-                    json.dump(
+                with open(temp_file, "wb") as f:
+                    f.write(orjson.dumps(
                         {key: entry.to_dict() for key, entry in cache_data.items()},
-                        f,
-                        indent=2,
-                        default=str
-                    )
+                        default=str,
+                    ))
                 temp_file.replace(self.cache_file)
+                _cache_file_exists[self.cache_file] = True
             except Exception as e:
                 self.logger.error(f"Error writing cache file: {e}")
 
+    async def load_persisted(self) -> int:
+        """Load entries persisted by a previous run into the memory cache.
+
+        Expired entries are kept as stale fallbacks when configured. Returns the
+        number of entries loaded.
+        """
+        loaded = 0
+        for key, entry in (await self._read_cache_file()).items():
+            if not entry.is_expired() or self.config.stale_fallback:
+                self._remember(key, entry)
+                loaded += 1
+        return loaded
+
     async def get(
         self,
         key: str,
@@ -176,10 +213,11 @@ class BaseCache(ABC, Generic[T]):
             entry = self._memory_cache[key]
             if not entry.is_expired():
                 self.logger.debug(f"Memory cache hit for {key}")
+                self._memory_cache.move_to_end(key)
 
                 # Check if stale and trigger background refresh
                 if entry.is_stale() and self.config.enable_background_refresh and fetch_func:
-                    asyncio.create_task(self._background_refresh(key, fetch_func, ttl))
+                    self._schedule_background_refresh(key, fetch_func, ttl)
 
                 return entry.data
 
@@ -190,28 +228,30 @@ class BaseCache(ABC, Generic[T]):
                 entry = file_cache[key]
                 if not entry.is_expired():
                     self.logger.debug(f"File cache hit for {key}")
-                    self._memory_cache[key] = entry
+                    self._remember(key, entry)
 
                     # Check if stale and trigger background refresh
                     if entry.is_stale() and self.config.enable_background_refresh and fetch_func:
-                        asyncio.create_task(self._background_refresh(key, fetch_func, ttl))
+                        self._schedule_background_refresh(key, fetch_func, ttl)
 
                     return entry.data
                 elif self.config.stale_fallback:
                     # Keep stale entry as fallback
-                    self._memory_cache[key] = entry
+                    self._remember(key, entry)
 
         # Cache miss or expired - fetch new data
         if fetch_func:
             try:
                 self.logger.info(f"Cache miss for {key}, fetching fresh data")
-                data = await fetch_func()
-                await self.set(key, data, ttl)
-                return data
+                if force_refresh:
+                    return await self._fetch_and_set(key, fetch_func, ttl)
+                return await self._fetch_single_flight(key, fetch_func, ttl)
             except Exception as e:
-                import traceback
-                self.logger.error(f"Error fetching data for {key}: {e}")
-                self.logger.error(f"Full traceback:\n{traceback.format_exc()}")
+                # Shared fetches log their failure once when the task finishes
+                if force_refresh:
+                    import traceback
+                    self.logger.error(f"Error fetching data for {key}: {e}")
+                    self.logger.error(f"Full traceback:\n{traceback.format_exc()}")
 
                 # Fall back to stale cache if available and configured
                 if self.config.stale_fallback and key in self._memory_cache:
@@ -222,13 +262,42 @@ class BaseCache(ABC, Generic[T]):
 
         return None
 
+    async def _fetch_and_set(self, key: str, fetch_func: Callable, ttl: int) -> T:
+        """Fetch fresh data and store it in the cache"""
+        data = await fetch_func()
+        await self.set(key, data, ttl)
+        return data
+
+    async def _fetch_single_flight(self, key: str, fetch_func: Callable, ttl: int) -> T:
+        """Fetch data for key, sharing one in-flight fetch between concurrent cache misses"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_set(key, fetch_func, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+        else:
+            self.logger.debug(f"Joining in-flight fetch for {key}")
+
+        # Shield so one cancelled caller doesn't cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task):
+        """Clear the in-flight fetch for key and log its failure once for all waiters"""
+        self._inflight.pop(key, None)
+        # Retrieving the exception also keeps asyncio quiet if every waiter was cancelled
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.logger.error(f"Error fetching data for {key}: {error}", exc_info=error)
+
     async def set(self, key: str, data: T, ttl: int | None = None):
         """Set item in cache"""
         ttl = ttl or self.config.default_ttl
         entry = CacheEntry(data, ttl)
 
         # Update memory cache
-        self._memory_cache[key] = entry
+        self._remember(key, entry)
 
         # Update filesystem cache
         file_cache = await self._read_cache_file()
@@ -249,16 +318,27 @@ class BaseCache(ABC, Generic[T]):
         else:
             # Invalidate entire cache
             self._memory_cache.clear()
-            if self.cache_file.exists():
-                self.cache_file.unlink()
+            self.cache_file.unlink(missing_ok=True)
+            _cache_file_exists[self.cache_file] = False
             self.logger.info(f"Invalidated entire {self.cache_name} cache")
 
-    async def _background_refresh(self, key: str, fetch_func: callable, ttl: int):
-        """Refresh cache entry in background"""
-        # Cancel any existing refresh task for this key
+    def _schedule_background_refresh(self, key: str, fetch_func: Callable, ttl: int):
+        """Start a background refresh for key unless one is already running"""
         if key in self._refresh_tasks:
-            self._refresh_tasks[key].cancel()
+            return
+        task = asyncio.create_task(self._background_refresh(key, fetch_func, ttl))
+        self._refresh_tasks[key] = task
 
+        def _forget(done: asyncio.Task):
+            if self._refresh_tasks.get(key) is done:
+                del self._refresh_tasks[key]
+
+        # Cleared from a done callback rather than inside the coroutine: under an eager
+        # task factory the refresh can finish before create_task returns
+        task.add_done_callback(_forget)
+
+    async def _background_refresh(self, key: str, fetch_func: Callable, ttl: int):
+        """Refresh cache entry in background"""
         try:
             self.logger.debug(f"Starting background refresh for {key}")
             data = await fetch_func()
@@ -266,12 +346,14 @@ class BaseCache(ABC, Generic[T]):
             self.logger.debug(f"Background refresh completed for {key}")
         except Exception as e:
             self.logger.error(f"Background refresh failed for {key}: {e}")
-        finally:
-            self._refresh_tasks.pop(key, None)
 
     async def get_stats(self) -> dict:
         """Get cache statistics"""
         file_cache = await self._read_cache_file()
+        try:
+            cache_file_size = self.cache_file.stat().st_size
+        except FileNotFoundError:
+            cache_file_size = 0
 
         total_entries = len(file_cache)
         expired_entries = sum(1 for entry in file_cache.values() if entry.is_expired())
@@ -283,7 +365,7 @@ class BaseCache(ABC, Generic[T]):
             "memory_entries": len(self._memory_cache),
             "expired_entries": expired_entries,
             "stale_entries": stale_entries,
-            "cache_file_size": self.cache_file.stat().st_size if self.cache_file.exists() else 0,
+            "cache_file_size": cache_file_size,
         }
 
     @abstractmethod
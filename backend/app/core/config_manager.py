@@ -19,11 +19,19 @@ class AppConfig(BaseModel):
     llm_model: str = "gpt-4"
     openai_api_key: str = ""
     anthropic_api_key: str = ""
+    llm_max_input_tokens: int = 100_000  # Longer prompts are trimmed in the middle; 0 disables
+    llm_max_concurrency: int = 16  # Max concurrent requests per provider in batch calls
+    llm_cache_db: str = ""  # SQLite file for the persistent LLM response cache; empty disables
+    llm_requests_per_minute: int = 500  # Client-side request rate limit per provider; 0 disables
+    semantic_cache_enabled: bool = False  # Reuse responses to near-duplicate prompts
+    semantic_cache_threshold: float = 0.97  # Minimum cosine similarity for a semantic cache hit
 
     # Rocketlane Configuration
     rocketlane_api_key: str = ""
     rocketlane_user_id: str = ""
     rocketlane_api_base_url: str = "https://api.rocketlane.com/api/1.0"
+    rocketlane_max_keepalive: int = 20  # Idle connections kept open to the Rocketlane API
+    rocketlane_keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
 
     # Application Settings
     api_host: str = "0.0.0.0"
@@ -72,11 +80,16 @@ class ConfigManager:
             llm_model=os.getenv("LLM_MODEL", "gpt-4"),
             openai_api_key=os.getenv("OPENAI_API_KEY", ""),
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
+            llm_cache_db=os.getenv("LLM_CACHE_DB", ""),
             rocketlane_api_key=os.getenv("ROCKETLANE_API_KEY", ""),
             rocketlane_user_id=os.getenv("ROCKETLANE_USER_ID", ""),
             rocketlane_api_base_url=os.getenv(
                 "ROCKETLANE_API_BASE_URL", "https://api.rocketlane.com/api/1.0"
             ),
+            rocketlane_max_keepalive=int(os.getenv("ROCKETLANE_HTTPX_MAX_KEEPALIVE", "20")),
+            rocketlane_keepalive_expiry=float(
+                os.getenv("ROCKETLANE_HTTPX_KEEPALIVE_EXPIRY", "30")
+            ),
             api_host=os.getenv("API_HOST", "0.0.0.0"),
             api_port=int(os.getenv("API_PORT", "8000")),
             debug_mode=os.getenv("DEBUG_MODE", "false").lower() == "true",
@@ -101,6 +114,22 @@ class ConfigManager:
         except Exception as e:
             print(f"Error saving config to {self.config_path}: {e}")
 
+    def _reset_clients(self, previous: AppConfig | None) -> None:
+        """Drop the shared Rocketlane client if its connection settings changed"""
+        current = self._config
+        if previous is None or current is None:
+            return
+        if (
+            previous.rocketlane_api_key == current.rocketlane_api_key
+            and previous.rocketlane_api_base_url == current.rocketlane_api_base_url
+        ):
+            return
+
+        # Imported lazily to keep core free of service imports at load time
+        from ..services.rocketlane import get_rocketlane_client
+
+        get_rocketlane_client.cache_clear()
+
     def get_config(self) -> AppConfig:
         """Get current configuration"""
         if self._config is None:
@@ -113,6 +142,8 @@ class ConfigManager:
         if self._config is None:
             self._load_config()
 
+        previous = self._config
+
         # Update only provided fields
         if self._config:
             config_dict = self._config.model_dump()
@@ -121,13 +152,16 @@ class ConfigManager:
 
         # Save to file
         self._save_config()
+        self._reset_clients(previous)
 
         assert self._config is not None  # After update, _config is always set
         return self._config
 
     def reload_config(self) -> AppConfig:
         """Reload configuration from file"""
+        previous = self._config
         self._load_config()
+        self._reset_clients(previous)
         assert self._config is not None  # After _load_config, _config is always set
         return self._config
 
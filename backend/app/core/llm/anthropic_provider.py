@@ -1,20 +1,75 @@
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
-from anthropic import NOT_GIVEN, AsyncAnthropic
+import httpx
+from anthropic import NOT_GIVEN, AsyncAnthropic, NotGiven
+from anthropic.types import TextBlock
 
-from .base import BaseLLMProvider
+from ..logging import get_logger
+from .base import BaseLLMProvider, get_http_client
 
 if TYPE_CHECKING:
-    from anthropic.types import MessageParam
+    from anthropic.types import Message, MessageParam, TextBlockParam, Usage
+
+logger = get_logger(__name__)
+
+# Anthropic won't cache prompt prefixes shorter than ~1024 tokens; characters are a cheap proxy
+MIN_CACHEABLE_SYSTEM_CHARS = 1024
+
+
+def _system_param(system_prompt: str | None) -> "str | list[TextBlockParam] | NotGiven":
+    """Build the system argument, marking long system prompts for provider-side prompt caching"""
+    if not system_prompt:
+        return NOT_GIVEN
+    if len(system_prompt) < MIN_CACHEABLE_SYSTEM_CHARS:
+        return system_prompt
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _log_cache_usage(usage: "Usage") -> None:
+    """Log prompt cache reads/writes so cache hits can be verified"""
+    if usage.cache_read_input_tokens or usage.cache_creation_input_tokens:
+        logger.debug(
+            f"Anthropic prompt cache: read={usage.cache_read_input_tokens} "
+            f"created={usage.cache_creation_input_tokens} input={usage.input_tokens}"
+        )
+
+
+def _response_text(message: "Message") -> str:
+    """Join the text blocks of a response, so multi-block replies aren't truncated"""
+    return "".join(block.text for block in message.content if isinstance(block, TextBlock))
+
+
+def _rate_limit_state(headers: httpx.Headers) -> tuple[int | None, float | None]:
+    """Parse (remaining requests, seconds until reset) from Anthropic rate-limit headers"""
+    remaining = headers.get("anthropic-ratelimit-requests-remaining")
+    reset = headers.get("anthropic-ratelimit-requests-reset")
+    reset_after = None
+    if reset:
+        try:
+            reset_at = datetime.fromisoformat(reset)
+            reset_after = max(0.0, (reset_at - datetime.now(UTC)).total_seconds())
+        except ValueError:
+            pass
+    return (int(remaining) if remaining and remaining.isdigit() else None), reset_after
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> AsyncAnthropic:
+    """Get the SDK client for an API key, built once on the shared HTTP client"""
+    return AsyncAnthropic(api_key=api_key, http_client=get_http_client())
 
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude LLM provider implementation"""
 
+    small_model = "claude-3-5-haiku-latest"
+
     def __init__(self, api_key: str, model: str = "claude-3-opus-20240229"):
         super().__init__(api_key, model)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key)
 
     async def generate_completion(
         self,
@@ -22,49 +77,61 @@ class AnthropicProvider(BaseLLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> str:
         messages: list[dict[str, Any]] = [{"role": "user", "content": prompt}]
-        typed_messages = cast("list[MessageParam]", messages)
 
-        response = await self.client.messages.create(
-            model=self.model,
-            messages=typed_messages,
-            system=system_prompt if system_prompt else NOT_GIVEN,
-            temperature=temperature,
-            max_tokens=max_tokens if max_tokens else 1024,
-        )
-        # Extract text from the response content
-        content = response.content[0]
-        return getattr(content, "text", "") if hasattr(content, "text") else str(content)
+        async def fetch() -> str:
+            typed_messages = cast("list[MessageParam]", self._truncate_messages(messages))
+
+            raw = await self.client.messages.with_raw_response.create(
+                model=model or self.model,
+                messages=typed_messages,
+                system=_system_param(self._truncate(system_prompt) if system_prompt else None),
+                temperature=temperature,
+                max_tokens=max_tokens if max_tokens else 1024,
+            )
+            self._observe_rate_limits(*_rate_limit_state(raw.headers))
+            response = raw.parse()
+            _log_cache_usage(response.usage)
+
+            return _response_text(response)
+
+        # Key on the same shape generate_chat_completion uses so both paths share entries
+        key_messages = messages
+        if system_prompt:
+            key_messages = [{"role": "system", "content": system_prompt}, *messages]
+        return await self._cached_completion(key_messages, temperature, max_tokens, model, fetch)
 
     async def generate_chat_completion(
         self,
         messages: list[dict[str, Any]],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> str:
-        # Convert messages format if needed
-        anthropic_messages: list[dict[str, Any]] = []
-        system_message: str | None = None
+        async def fetch() -> str:
+            # Anthropic takes the system prompt separately from the conversation
+            system_message = next((m["content"] for m in messages if m["role"] == "system"), None)
+            typed_messages = cast(
+                "list[MessageParam]",
+                self._truncate_messages([m for m in messages if m["role"] != "system"]),
+            )
 
-        for msg in messages:
-            if msg["role"] == "system":
-                system_message = msg["content"]
-            else:
-                anthropic_messages.append({"role": msg["role"], "content": msg["content"]})
+            raw = await self.client.messages.with_raw_response.create(
+                model=model or self.model,
+                messages=typed_messages,
+                system=_system_param(self._truncate(system_message) if system_message else None),
+                temperature=temperature,
+                max_tokens=max_tokens if max_tokens else 1024,
+            )
+            self._observe_rate_limits(*_rate_limit_state(raw.headers))
+            response = raw.parse()
+            _log_cache_usage(response.usage)
 
-        typed_messages = cast("list[MessageParam]", anthropic_messages)
+            return _response_text(response)
 
-        response = await self.client.messages.create(
-            model=self.model,
-            messages=typed_messages,
-            system=system_message if system_message else NOT_GIVEN,
-            temperature=temperature,
-            max_tokens=max_tokens if max_tokens else 1024,
-        )
-        # Extract text from the response content
-        content = response.content[0]
-        return getattr(content, "text", "") if hasattr(content, "text") else str(content)
+        return await self._cached_completion(messages, temperature, max_tokens, model, fetch)
 
     async def stream_completion(
         self,
@@ -72,15 +139,17 @@ class AnthropicProvider(BaseLLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> AsyncGenerator[str]:
         """Stream a completion from Anthropic"""
         messages: list[dict[str, Any]] = [{"role": "user", "content": prompt}]
-        typed_messages = cast("list[MessageParam]", messages)
+        typed_messages = cast("list[MessageParam]", self._truncate_messages(messages))
 
+        await self._throttle()
         async with self.client.messages.stream(
-            model=self.model,
+            model=model or self.model,
             messages=typed_messages,
-            system=system_prompt if system_prompt else NOT_GIVEN,
+            system=_system_param(self._truncate(system_prompt) if system_prompt else None),
             temperature=temperature,
             max_tokens=max_tokens if max_tokens else 1024,
         ) as stream:
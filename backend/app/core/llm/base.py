@@ -1,13 +1,505 @@
+import asyncio
+import hashlib
+import math
+import re
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import httpx
+import orjson
+
+from ..config import settings
+from ..logging import get_logger
+
+if TYPE_CHECKING:
+    import tiktoken
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP/2 client shared by all LLM SDK clients.
+
+    Reusing one client keeps TLS connections to the provider APIs alive across requests.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        # Completions can take minutes; the SDKs also pass their own per-request timeouts
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """Get the tokenizer for a model, approximating with o200k_base for non-OpenAI models"""
+    # Imported on first use: only oversized prompts need a tokenizer, and loading it is slow
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _match_choice(answer: str, choices: list[str]) -> str:
+    """Map a model's reply onto one of choices, tolerating case, quotes and punctuation"""
+    normalized = answer.strip().strip("\"'`.!").lower()
+    for choice in choices:
+        if normalized == choice.lower():
+            return choice
+    for choice in choices:
+        if choice.lower() in normalized:
+            return choice
+    raise ValueError(f"LLM answer {answer!r} is not one of {choices}")
+
+
+class TokenBucket:
+    """Client-side request rate limiter holding up to capacity tokens, refilled per second"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and take a token for it"""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    def update(self, remaining: int | None, reset_after: float | None) -> None:
+        """Align with the provider's rate-limit headers.
+
+        Never allows more requests than the provider says remain, and when none remain,
+        holds new requests until the provider's window resets.
+        """
+        if remaining is None:
+            return
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+        if remaining <= 0 and reset_after:
+            self._tokens = min(self._tokens, 1 - reset_after * self.refill_rate)
+
+
+# Emails, phone numbers and card-like digit runs; such exchanges never enter the semantic cache
+_PII_PATTERN = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.-]+"
+    r"|\+?\d[\d\s().-]{7,}\d"
+    r"|\b(?:\d[ -]?){13,16}\b"
+)
+
+
+def _contains_pii(text: str) -> bool:
+    return _PII_PATTERN.search(text) is not None
+
+
+class SemanticCache:
+    """In-process cache matching prompts by embedding similarity rather than exact text.
+
+    Entries are grouped by scope (everything about a request except the prompt text),
+    so only prompts sent with the same model, system prompt and limits can match.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        # scope -> [(stored at, unit vector, response)], oldest first
+        self._entries: dict[str, list[tuple[float, list[float], str]]] = {}
+        self._size = 0
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        norm = math.sqrt(math.sumprod(vector, vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def get(
+        self, scope: str, vector: list[float], threshold: float, max_age: float
+    ) -> str | None:
+        """Get the response of the most similar live entry in scope, if similar enough"""
+        entries = self._entries.get(scope)
+        if not entries:
+            return None
+        query = self._normalize(vector)
+        now = time.monotonic()
+        best_score, best = threshold, None
+        for stored_at, stored, response in entries:
+            if now - stored_at > max_age:
+                continue
+            score = math.sumprod(query, stored)
+            if score >= best_score:
+                best_score, best = score, response
+        return best
+
+    def put(self, scope: str, vector: list[float], response: str) -> None:
+        """Store a response, evicting the oldest entries past the size limit"""
+        self._entries.setdefault(scope, []).append(
+            (time.monotonic(), self._normalize(vector), response)
+        )
+        self._size += 1
+        while self._size > self.max_entries:
+            oldest_scope = min(self._entries, key=lambda s: self._entries[s][0][0])
+            bucket = self._entries[oldest_scope]
+            bucket.pop(0)
+            if not bucket:
+                del self._entries[oldest_scope]
+            self._size -= 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+class SQLiteLLMCache:
+    """Disk-backed second-level response cache, so cached responses survive restarts.
+
+    sqlite3 calls run in a worker thread to keep them off the event loop.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str, max_age: float) -> tuple[str, float] | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT response, created_at FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        age = time.time() - row[1]
+        return (row[0], age) if age <= max_age else None
+
+    def _put(self, key: str, response: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            conn.commit()
+
+    async def get(self, key: str, max_age: float) -> tuple[str, float] | None:
+        """Get (response, age in seconds) for key if it is younger than max_age"""
+        return await asyncio.to_thread(self._get, key, max_age)
+
+    async def put(self, key: str, response: str) -> None:
+        """Store a response for key"""
+        await asyncio.to_thread(self._put, key, response)
+
+
+@lru_cache(maxsize=2)
+def _open_disk_cache(path: str) -> SQLiteLLMCache:
+    return SQLiteLLMCache(path)
+
+
+def get_disk_cache() -> SQLiteLLMCache | None:
+    """Get the SQLite response cache configured by settings.llm_cache_db, if any"""
+    path = settings.llm_cache_db
+    return _open_disk_cache(path) if path else None
+
+
+async def close_http_client() -> None:
+    """Close the shared LLM HTTP client if it was ever created"""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
 
 
 class BaseLLMProvider(ABC):
     """Base class for LLM providers"""
 
+    # Process-wide response cache shared by all provider instances: key -> (stored at, text)
+    _response_cache: ClassVar[OrderedDict[str, tuple[float, str]]] = OrderedDict()
+    cache_max_entries: ClassVar[int] = 256
+    cache_ttl: ClassVar[float] = 3600.0
+    # Sampled (temperature > 0) responses are meant to vary, so they are not cached by default
+    cache_sampled_responses: ClassVar[bool] = False
+    # Near-duplicate prompt cache, used when settings.semantic_cache_enabled is on
+    _semantic_cache: ClassVar[SemanticCache] = SemanticCache()
+    # Requests currently in flight, so concurrent identical calls share one API request
+    _inflight: ClassVar[dict[str, asyncio.Task]] = {}
+    # Smaller, faster model used for classification-style calls (None: use self.model)
+    small_model: ClassVar[str | None] = None
+
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
+        self._semaphore = asyncio.Semaphore(settings.llm_max_concurrency or 16)
+        rpm = settings.llm_requests_per_minute
+        # Allow short bursts of up to ~6 seconds' worth of requests
+        self._bucket = TokenBucket(max(1, rpm // 10), rpm / 60) if rpm > 0 else None
+
+    async def _throttle(self) -> None:
+        """Wait for the client-side rate limiter before sending a request"""
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+    def _observe_rate_limits(self, remaining: int | None, reset_after: float | None) -> None:
+        """Feed the provider's reported request budget back into the rate limiter"""
+        if self._bucket is not None:
+            self._bucket.update(remaining, reset_after)
+
+    async def _guarded(self, coro: Awaitable[str]) -> str:
+        """Await coro while holding one of the provider's concurrency slots"""
+        async with self._semaphore:
+            return await coro
+
+    async def generate_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        model: str | None = None,
+    ) -> list[str]:
+        """Generate completions for several prompts concurrently.
+
+        At most settings.llm_max_concurrency requests run at once; results keep prompt order.
+        """
+        return await asyncio.gather(
+            *(
+                self._guarded(
+                    self.generate_completion(
+                        prompt, system_prompt, temperature, max_tokens, model
+                    )
+                )
+                for prompt in prompts
+            )
+        )
+
+    async def classify(self, prompt: str, choices: list[str], model: str | None = None) -> str:
+        """Pick one of choices for prompt using a short deterministic completion.
+
+        Uses small_model unless a model is given. Raises ValueError if the reply
+        doesn't name one of the choices.
+        """
+        system_prompt = (
+            "Answer with exactly one of the following options and nothing else: "
+            + ", ".join(choices)
+        )
+        answer = await self.generate_completion(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=0.0,
+            max_tokens=16,
+            model=model or self.small_model,
+        )
+        return _match_choice(answer, choices)
+
+    def _truncate(self, text: str, max_tokens: int | None = None) -> str:
+        """Cap text at max_tokens (default: settings.llm_max_input_tokens), keeping head and tail"""
+        limit = max_tokens if max_tokens is not None else settings.llm_max_input_tokens
+        # A token covers at least one UTF-8 byte, so short text can skip tokenizing
+        if limit <= 0 or len(text) * 4 <= limit:
+            return text
+
+        encoding = _get_encoding(self.model)
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= limit:
+            return text
+
+        head = limit // 2
+        tail = limit - head
+        return encoding.decode(tokens[:head]) + "\n...\n" + encoding.decode(tokens[-tail:])
+
+    def _truncate_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply _truncate to the content of each message.
+
+        Returns messages itself when nothing needed trimming, which is the common case.
+        """
+        truncated = None
+        for i, msg in enumerate(messages):
+            content = self._truncate(msg["content"])
+            if content is not msg["content"]:
+                if truncated is None:
+                    truncated = list(messages)
+                truncated[i] = {**msg, "content": content}
+        return messages if truncated is None else truncated
+
+    def _cache_key(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int | None,
+        model: str | None = None,
+    ) -> str | None:
+        """Build the response cache key for a request, or None if it shouldn't be cached"""
+        if temperature > 0.0 and not self.cache_sampled_responses:
+            return None
+        payload = {
+            "provider": type(self).__name__,
+            "model": model or self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return hashlib.blake2b(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Embed text for the semantic cache, or None if the provider has no embeddings API"""
+        return None
+
+    def _semantic_query(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int | None,
+        model: str | None,
+    ) -> tuple[str, str] | None:
+        """Split a request into (scope key, prompt text) for the semantic cache.
+
+        Returns None when the request must not use it: the cache is disabled, the
+        response is sampled, or the prompt contains PII.
+        """
+        if not settings.semantic_cache_enabled or temperature > 0.0 or not messages:
+            return None
+        prompt = messages[-1]["content"]
+        if not isinstance(prompt, str) or _contains_pii(prompt):
+            return None
+        scope = self._cache_key(messages[:-1], temperature, max_tokens, model)
+        return (scope, prompt) if scope is not None else None
+
+    def _cache_get(self, key: str | None) -> str | None:
+        """Get a cached response, dropping it if it has outlived the cache TTL"""
+        if key is None:
+            return None
+        cached = self._response_cache.get(key)
+        if cached is None:
+            return None
+        stored_at, response = cached
+        if time.monotonic() - stored_at > self.cache_ttl:
+            self._response_cache.pop(key, None)
+            return None
+        self._response_cache.move_to_end(key)
+        return response
+
+    def _cache_put(self, key: str | None, response: str, age: float = 0.0) -> None:
+        """Cache a response, evicting the least recently used entries past the size limit"""
+        if key is None:
+            return
+        self._response_cache[key] = (time.monotonic() - age, response)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.cache_max_entries:
+            self._response_cache.popitem(last=False)
+
+    async def _cached_completion(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int | None,
+        model: str | None,
+        fetch: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Run fetch unless the response is cached or the same request is already in flight"""
+        key = self._cache_key(messages, temperature, max_tokens, model)
+        if key is None:
+            await self._throttle()
+            return await fetch()
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            semantic = self._semantic_query(messages, temperature, max_tokens, model)
+            task = asyncio.create_task(self._fetch_and_cache(key, fetch, semantic))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+
+        # Shield so one cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[str]],
+        semantic: tuple[str, str] | None = None,
+    ) -> str:
+        """Serve from the disk or semantic cache if possible, otherwise run the API request.
+
+        semantic is the (scope, prompt) from _semantic_query, if the request may use it.
+        """
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            try:
+                hit = await disk_cache.get(key, self.cache_ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM disk cache read failed: {e}")
+                hit = None
+            if hit is not None:
+                response, age = hit
+                self._cache_put(key, response, age)
+                return response
+
+        vector = None
+        if semantic is not None:
+            scope, prompt = semantic
+            try:
+                vector = await self.embed(prompt)
+            except Exception as e:
+                logger.warning(f"Embedding for semantic cache failed: {e}")
+            if vector is not None:
+                response = self._semantic_cache.get(
+                    scope, vector, settings.semantic_cache_threshold, self.cache_ttl
+                )
+                if response is not None:
+                    self._cache_put(key, response)
+                    return response
+
+        await self._throttle()
+        response = await fetch()
+        self._cache_put(key, response)
+        if vector is not None and semantic is not None and not _contains_pii(response):
+            self._semantic_cache.put(semantic[0], vector, response)
+
+        if disk_cache is not None:
+            try:
+                await disk_cache.put(key, response)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM disk cache write failed: {e}")
+        return response
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        """Clear the in-flight request for key"""
+        self._inflight.pop(key, None)
+        # Retrieve the exception so asyncio stays quiet if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
 
     @abstractmethod
     async def generate_completion(
@@ -16,6 +508,7 @@ class BaseLLMProvider(ABC):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> str:
         """Generate a completion from the LLM"""
         pass
@@ -26,6 +519,7 @@ class BaseLLMProvider(ABC):
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> str:
         """Generate a chat completion from the LLM"""
         pass
@@ -37,6 +531,7 @@ class BaseLLMProvider(ABC):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> AsyncGenerator[str]:
         """Stream a completion from the LLM"""
         pass
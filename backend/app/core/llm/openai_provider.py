@@ -1,20 +1,49 @@
+import re
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
+import httpx
+import orjson
 from openai import AsyncOpenAI
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, get_http_client
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletionMessageParam
 
+# Durations in OpenAI's x-ratelimit-reset-* headers look like "1s", "6m0s" or "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _rate_limit_state(headers: httpx.Headers) -> tuple[int | None, float | None]:
+    """Parse (remaining requests, seconds until reset) from OpenAI rate-limit headers"""
+    remaining = headers.get("x-ratelimit-remaining-requests")
+    reset = headers.get("x-ratelimit-reset-requests")
+    reset_after = (
+        sum(float(value) * _UNIT_SECONDS[unit] for value, unit in _DURATION_PART.findall(reset))
+        if reset
+        else None
+    )
+    return (int(remaining) if remaining and remaining.isdigit() else None), reset_after
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Get the SDK client for an API key, built once on the shared HTTP client"""
+    return AsyncOpenAI(api_key=api_key, http_client=get_http_client())
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI LLM provider implementation"""
 
+    small_model = "gpt-4o-mini"
+    embedding_model = "text-embedding-3-small"
+
     def __init__(self, api_key: str, model: str = "gpt-4"):
         super().__init__(api_key, model)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
 
     async def generate_completion(
         self,
@@ -22,37 +51,107 @@ class OpenAIProvider(BaseLLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> str:
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
-        return await self.generate_chat_completion(messages, temperature, max_tokens)
+        messages: list[dict[str, Any]] = (
+            [{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}]
+            if system_prompt
+            else [{"role": "user", "content": prompt}]
+        )
+        return await self._cached_completion(
+            messages,
+            temperature,
+            max_tokens,
+            model,
+            lambda: self._create_completion(messages, temperature, max_tokens, model),
+        )
 
     async def generate_chat_completion(
         self,
         messages: list[dict[str, Any]],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
+    ) -> str:
+        return await self._cached_completion(
+            messages,
+            temperature,
+            max_tokens,
+            model,
+            lambda: self._create_completion(messages, temperature, max_tokens, model),
+        )
+
+    async def _create_completion(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int | None,
+        model: str | None,
     ) -> str:
+        """Send a chat completion request and return the reply text"""
         # Cast messages to the expected type for OpenAI API
-        typed_messages = cast("list[ChatCompletionMessageParam]", messages)
+        typed_messages = cast("list[ChatCompletionMessageParam]", self._truncate_messages(messages))
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
+        raw = await self.client.chat.completions.with_raw_response.create(
+            model=model or self.model,
             messages=typed_messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
+        self._observe_rate_limits(*_rate_limit_state(raw.headers))
+        response = raw.parse()
         return response.choices[0].message.content or ""
 
+    async def embed(self, text: str) -> list[float] | None:
+        """Embed text for the semantic cache"""
+        await self._throttle()
+        raw = await self.client.embeddings.with_raw_response.create(
+            model=self.embedding_model, input=self._truncate(text, 8000)
+        )
+        self._observe_rate_limits(*_rate_limit_state(raw.headers))
+        return raw.parse().data[0].embedding
+
+    async def classify(self, prompt: str, choices: list[str], model: str | None = None) -> str:
+        """Pick one of choices, constrained by a structured-output enum so no parsing can fail"""
+        messages = [{"role": "user", "content": prompt}]
+        schema = {
+            "type": "object",
+            "properties": {"choice": {"type": "string", "enum": choices}},
+            "required": ["choice"],
+            "additionalProperties": False,
+        }
+
+        async def fetch() -> str:
+            typed_messages = cast(
+                "list[ChatCompletionMessageParam]", self._truncate_messages(messages)
+            )
+            raw = await self.client.chat.completions.with_raw_response.create(
+                model=model or self.small_model,
+                messages=typed_messages,
+                temperature=0.0,
+                max_tokens=32,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": "classification", "schema": schema, "strict": True},
+                },
+            )
+            self._observe_rate_limits(*_rate_limit_state(raw.headers))
+            response = raw.parse()
+            return orjson.loads(response.choices[0].message.content or "{}")["choice"]
+
+        # The choices shape the request, so they belong in the cache key
+        key_messages = [{"role": "system", "content": "choices: " + ", ".join(choices)}, *messages]
+        return await self._cached_completion(
+            key_messages, 0.0, 32, model or self.small_model, fetch
+        )
+
     async def stream_completion(
         self,
         prompt: str,
         system_prompt: str | None = None,
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        model: str | None = None,
     ) -> AsyncGenerator[str]:
         """Stream a completion from OpenAI"""
         messages = []
@@ -60,10 +159,11 @@ class OpenAIProvider(BaseLLMProvider):
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        typed_messages = cast("list[ChatCompletionMessageParam]", messages)
+        typed_messages = cast("list[ChatCompletionMessageParam]", self._truncate_messages(messages))
 
+        await self._throttle()
         stream = await self.client.chat.completions.create(
-            model=self.model,
+            model=model or self.model,
             messages=typed_messages,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -71,7 +171,8 @@ class OpenAIProvider(BaseLLMProvider):
         )
 
         async for chunk in stream:
-            if chunk.choices[0].delta.content:
+            # Some chunks (e.g. usage-only ones) carry no choices
+            if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
     async def transcribe_audio(self, audio_data: bytes, language: str | None = None) -> str:
@@ -1,8 +1,25 @@
+from functools import lru_cache
+
 from ..config import settings
+from . import anthropic_provider, openai_provider
 from .anthropic_provider import AnthropicProvider
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, close_http_client
 from .openai_provider import OpenAIProvider
 
+# Provider type -> (provider class, settings attribute holding its API key)
+_REGISTRY: dict[str, tuple[type[BaseLLMProvider], str]] = {
+    "openai": (OpenAIProvider, "openai_api_key"),
+    "anthropic": (AnthropicProvider, "anthropic_api_key"),
+}
+
+
+@lru_cache(maxsize=4)
+def _build_provider(
+    provider_cls: type[BaseLLMProvider], model: str, api_key: str
+) -> BaseLLMProvider:
+    """Build a provider, reusing the instance while its type, model and key are unchanged"""
+    return provider_cls(api_key=api_key, model=model)
+
 
 class LLMProvider:
     """Factory for creating LLM providers"""
@@ -12,14 +29,22 @@ class LLMProvider:
         """Create an LLM provider based on configuration"""
         provider_type = provider_type or settings.llm_provider
 
-        if provider_type == "openai":
-            return OpenAIProvider(api_key=settings.openai_api_key, model=settings.llm_model)
-        elif provider_type == "anthropic":
-            return AnthropicProvider(api_key=settings.anthropic_api_key, model=settings.llm_model)
-        else:
+        entry = _REGISTRY.get(provider_type)
+        if entry is None:
             raise ValueError(f"Unknown LLM provider: {provider_type}")
 
+        provider_cls, api_key_setting = entry
+        return _build_provider(provider_cls, settings.llm_model, getattr(settings, api_key_setting))
+
 
 def get_llm_provider() -> BaseLLMProvider:
     """Get the configured LLM provider instance"""
     return LLMProvider.create()
+
+
+async def close_llm_clients() -> None:
+    """Drop cached providers and SDK clients and close the shared HTTP client"""
+    _build_provider.cache_clear()
+    openai_provider._get_client.cache_clear()
+    anthropic_provider._get_client.cache_clear()
+    await close_http_client()
@@ -41,27 +41,30 @@ def log_request_details(
     params: dict | None = None,
 ):
     """Log HTTP request details when in debug mode"""
-    if getattr(settings, "debug_mode", False):
-        logger.debug(f"Request: {method} {url}")
-        if headers:
-            # Mask sensitive headers
-            safe_headers = headers.copy()
-            if "api-key" in safe_headers:
-                safe_headers["api-key"] = (
-                    safe_headers["api-key"][:10] + "..." if safe_headers["api-key"] else "None"
-                )
-            logger.debug(f"Headers: {safe_headers}")
-        if params:
-            logger.debug(f"Params: {params}")
+    # get_logger only enables DEBUG in debug mode, so the level check stands in for the setting
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Request: %s %s", method, url)
+    if headers:
+        # Mask sensitive headers
+        safe_headers = headers.copy()
+        if "api-key" in safe_headers:
+            safe_headers["api-key"] = (
+                safe_headers["api-key"][:10] + "..." if safe_headers["api-key"] else "None"
+            )
+        logger.debug("Headers: %s", safe_headers)
+    if params:
+        logger.debug("Params: %s", params)
 
 
 def log_response_details(
     logger: logging.Logger, status_code: int, response_text: str | None = None
 ):
     """Log HTTP response details when in debug mode"""
-    if getattr(settings, "debug_mode", False):
-        logger.debug(f"Response Status: {status_code}")
-        if response_text:
-            # Truncate long responses
-            truncated = response_text[:1000] + "..." if len(response_text) > 1000 else response_text
-            logger.debug(f"Response Body: {truncated}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Response Status: %s", status_code)
+    if response_text:
+        # Truncate long responses
+        truncated = response_text[:1000] + "..." if len(response_text) > 1000 else response_text
+        logger.debug("Response Body: %s", truncated)
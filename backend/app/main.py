@@ -2,22 +2,21 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import date, timedelta
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api import api_router
 from .api.dependencies import verify_user_id_configured
 from .core.config import settings
+from .core.llm.provider import close_llm_clients
 from .core.otel_config import configure_otel
 from .core.telemetry import instrument_app
-from .services.project_cache_v2 import ProjectCacheService
-from .services.tasks_cache_v2 import tasks_cache_v2
-from .services.time_entries_cache import time_entries_cache
-from .services.time_entry_categories_cache import time_entry_categories_cache
-from .services.user_cache import UserCacheService
-from .services.user_statistics_cache import user_statistics_cache
 from .services.google_calendar import google_calendar_service
+from .services.rocketlane import close_rocketlane_http_client, get_rocketlane_client
 
 # Configure OpenTelemetry BEFORE creating the app
 configure_otel()
@@ -36,130 +35,190 @@ else:
 
 logger = logging.getLogger(__name__)
 
-# Cache services
-project_cache = ProjectCacheService()
-user_cache = UserCacheService()
-
-# Background tasks
-background_tasks = []
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle events."""
     # Startup
     logger.info("Starting application...")
 
-    # Warm caches if API keys are configured
-    if settings.rocketlane_api_key:
-        logger.info("Warming caches at startup...")
-
-        # Build list of cache warming tasks - these don't depend on each other
-        warm_tasks = [
-            project_cache.warm_cache(),
-            user_cache.warm_cache(),
-        ]
-
-        # Add user-specific cache warming if user is configured
-        if settings.rocketlane_user_id:
-            # Calculate current week for time entries cache
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            start_of_week = today - timedelta(days=today.weekday())
-            end_of_week = start_of_week + timedelta(days=6)
-            date_from = start_of_week.strftime("%Y-%m-%d")
-            date_to = end_of_week.strftime("%Y-%m-%d")
-
-            warm_tasks.extend([
-                user_statistics_cache.warm_cache(),
-                tasks_cache_v2.warm_cache(),
-                time_entry_categories_cache.warm_cache(),
-                time_entries_cache.warm_cache(date_from, date_to),
-            ])
-
-        # Start cache warming in background (non-blocking)
-        async def warm_caches_in_background():
-            try:
-                results = await asyncio.gather(*warm_tasks, return_exceptions=True)
-                # Log any failures
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Cache warming failed for task {i}: {result}")
-                logger.info("Cache warming completed")
-            except Exception as e:
-                logger.error(f"Error during cache warming: {e}")
-        
-        # Create background task for cache warming (don't await it)
-        cache_warm_task = asyncio.create_task(warm_caches_in_background())
-        background_tasks.append(cache_warm_task)
-
-        # Start periodic refresh tasks
-        logger.info("Starting periodic cache refresh tasks...")
-        project_refresh_task = asyncio.create_task(
-            project_cache.refresh_cache_periodically(interval=86400)  # 1 day (changed from 30 min)
-        )
-        user_refresh_task = asyncio.create_task(
-            user_cache.refresh_cache_periodically(interval=86400)  # 1 day (unchanged)
-        )
-
-        # Start user-specific cache refresh if user is configured
-        if settings.rocketlane_user_id:
-            user_stats_refresh_task = asyncio.create_task(
-                user_statistics_cache.refresh_cache_periodically(interval=300)  # 5 minutes
-            )
-            tasks_refresh_task = asyncio.create_task(
-                tasks_cache_v2.refresh_cache_periodically(interval=3600)  # 1 hour (changed from 5 min)
-            )
-            categories_refresh_task = asyncio.create_task(
-                time_entry_categories_cache.refresh_cache_periodically(interval=86400)  # 24 hours
-            )
-            # Note: time_entries_cache doesn't need periodic refresh as it has short TTL (15 min)
-            # and is refreshed on demand
-            background_tasks.extend([
-                project_refresh_task,
-                user_refresh_task,
-                user_stats_refresh_task,
-                tasks_refresh_task,
-                categories_refresh_task
-            ])
-        else:
-            background_tasks.extend([project_refresh_task, user_refresh_task])
-    
+    # Run new tasks eagerly until they first block, so cache hits skip the scheduler entirely
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Start Google Calendar sync task if authenticated
     async def google_calendar_refresh_task():
-        """Periodically sync Google Calendar events if authenticated."""
+        """Sync Google Calendar events every 15 minutes, or sooner when a sync is requested."""
+        # Unauthenticated checks back off from 1 minute up to an hour
+        consecutive_unauth = 0
         while True:
+            interval = 900  # 15 minutes
             try:
                 status = google_calendar_service.get_status()
                 if status.is_authenticated:
+                    consecutive_unauth = 0
                     logger.info("Running periodic Google Calendar sync...")
                     success = await google_calendar_service.sync_events()
                     if success:
                         logger.info(f"Google Calendar sync completed. Events: {len(google_calendar_service.get_cached_events())}")
                     else:
                         logger.warning("Google Calendar sync failed")
-                await asyncio.sleep(900)  # 15 minutes
+                else:
+                    interval = min(3600, 60 * 2**consecutive_unauth)
+                    consecutive_unauth += 1
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in Google Calendar refresh task: {e}")
-                await asyncio.sleep(900)  # Continue after error
-    
-    gcal_task = asyncio.create_task(google_calendar_refresh_task())
-    background_tasks.append(gcal_task)
+                logger.exception("Error in Google Calendar refresh task: %s", e)
 
-    yield
+            # Persist synced events and refreshed tokens in one write per cycle
+            google_calendar_service.flush()
 
-    # Shutdown
-    logger.info("Shutting down application...")
+            # Wait for the next interval or an explicit sync request (e.g. after OAuth)
+            try:
+                await asyncio.wait_for(google_calendar_service.sync_wake.wait(), timeout=interval)
+            except TimeoutError:
+                pass
+            google_calendar_service.sync_wake.clear()
 
-    # Cancel background tasks
-    for task in background_tasks:
-        task.cancel()
+    async def google_token_refresh_task():
+        """Refresh the Google access token ahead of expiry, checking periodically."""
+        while True:
+            try:
+                await google_calendar_service.ensure_fresh()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception("Error refreshing Google Calendar token: %s", e)
+            await asyncio.sleep(google_calendar_service.PROACTIVE_REFRESH_INTERVAL.total_seconds())
+
+    # Background tasks live in one task group, so a failed startup never leaks them
+    async with asyncio.TaskGroup() as tg:
+        background_tasks: list[asyncio.Task] = []
+
+        def start_background(coro) -> asyncio.Task:
+            task = tg.create_task(coro)
+            background_tasks.append(task)
+            return task
+
+        # Warm caches if API keys are configured
+        if settings.rocketlane_api_key:
+            # Warm the instances the routes serve from, so warmed data is already in memory
+            from .api.routes.projects import project_cache
+            from .api.routes.users import user_cache
+            from .services.tasks_cache_v2 import tasks_cache_v2
+            from .services.time_entries_cache import time_entries_cache
+            from .services.time_entry_categories_cache import time_entry_categories_cache
+            from .services.user_statistics_cache import user_statistics_cache
+
+            # Serve what the last run persisted straight from memory; warms only fetch the rest
+            persisted_caches = [project_cache, user_cache]
+            if settings.rocketlane_user_id:
+                persisted_caches.extend([
+                    user_statistics_cache,
+                    tasks_cache_v2,
+                    time_entry_categories_cache,
+                    time_entries_cache,
+                ])
+            loaded = await asyncio.gather(*(c.load_persisted() for c in persisted_caches))
+            logger.info(f"Loaded {sum(loaded)} persisted cache entries")
+
+            logger.info("Warming caches at startup...")
+
+            # Open the API connection now so the first request doesn't pay for the handshake
+            start_background(get_rocketlane_client().warm_up())
+
+            # Warms run in two lanes: plain fetches, and fetches with heavier aggregation
+            io_sem = asyncio.Semaphore(2)
+            cpu_sem = asyncio.Semaphore(1)
+
+            # Build list of cache warming tasks - these don't depend on each other
+            warm_tasks = [
+                (project_cache.warm_cache(), io_sem),
+                (user_cache.warm_cache(), io_sem),
+            ]
+
+            # Add user-specific cache warming if user is configured
+            if settings.rocketlane_user_id:
+                # Calculate current week for time entries cache
+                today = date.today()
+                start_of_week = today - timedelta(days=today.weekday())
+                date_from = start_of_week.isoformat()
+                date_to = (start_of_week + timedelta(days=6)).isoformat()
+
+                warm_tasks.extend([
+                    # Several dependent fetches plus aggregation; kept off the I/O lane
+                    (user_statistics_cache.warm_cache(), cpu_sem),
+                    (tasks_cache_v2.warm_cache(), io_sem),
+                    (time_entry_categories_cache.warm_cache(), io_sem),
+                    (time_entries_cache.warm_cache(date_from, date_to), io_sem),
+                ])
+
+            # Start cache warming in background (non-blocking)
+            async def warm_caches_in_background():
+                # Overlap warms, but only a few at a time so startup doesn't burst the API
+                async def _bounded(i, coro, sem):
+                    async with sem:
+                        try:
+                            await coro
+                        except Exception as e:
+                            logger.error("Cache warming failed for task %d: %s", i, e)
+
+                try:
+                    tasks = [
+                        start_background(_bounded(i, c, sem))
+                        for i, (c, sem) in enumerate(warm_tasks)
+                    ]
+                    for fut in asyncio.as_completed(tasks):
+                        await fut
+                    logger.info("Cache warming completed")
+                except Exception as e:
+                    logger.exception("Error during cache warming: %s", e)
+
+            # Create background task for cache warming (don't await it)
+            start_background(warm_caches_in_background())
+
+            # Start periodic refresh tasks
+            logger.info("Starting periodic cache refresh tasks...")
+            start_background(
+                project_cache.refresh_cache_periodically(interval=86400)  # 1 day (changed from 30 min)
+            )
+            start_background(
+                user_cache.refresh_cache_periodically(interval=86400)  # 1 day (unchanged)
+            )
 
-    # Wait for tasks to complete cancellation
-    if background_tasks:
-        await asyncio.gather(*background_tasks, return_exceptions=True)
+            # Start user-specific cache refresh if user is configured
+            if settings.rocketlane_user_id:
+                start_background(
+                    user_statistics_cache.refresh_cache_periodically(interval=300)  # 5 minutes
+                )
+                start_background(
+                    tasks_cache_v2.refresh_cache_periodically(interval=3600)  # 1 hour (changed from 5 min)
+                )
+                start_background(
+                    time_entry_categories_cache.refresh_cache_periodically(interval=86400)  # 24 hours
+                )
+                # Note: time_entries_cache doesn't need periodic refresh as it has short TTL (15 min)
+                # and is refreshed on demand
+
+        start_background(google_calendar_refresh_task())
+        if google_calendar_service.config.is_configured:
+            start_background(google_token_refresh_task())
+
+        yield
+
+        # Shutdown
+        logger.info("Shutting down application...")
+
+        # The refresh loops never finish on their own, so cancel them for the group to exit
+        for task in background_tasks:
+            task.cancel()
+        _, pending = await asyncio.wait(background_tasks, timeout=5.0)
+        for task in pending:
+            # The group still waits for these; name them so a hung shutdown can be traced
+            logger.warning("Background task did not cancel within 5s: %r", task)
+
+    google_calendar_service.flush()
+    await close_llm_clients()
+    await close_rocketlane_http_client()
 
     logger.info("Application shutdown complete")
 
@@ -169,6 +228,7 @@ app = FastAPI(
     description="AI-powered assistant for Rocketlane project management",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -181,19 +241,23 @@ app.add_middleware(
 )
 
 
+# Paths that never need a configured user, checked before the full exemption logic
+PUBLIC_PATHS = frozenset({
+    "/",
+    "/health",
+    "/docs",
+    "/openapi.json",
+    "/api/v1/integrations/google-calendar/callback",
+})
+
+
 # Add middleware to enforce user ID requirement
 @app.middleware("http")
 async def enforce_user_id_middleware(request: Request, call_next):
     """Middleware to enforce user ID configuration for protected endpoints"""
-    try:
+    if request.url.path not in PUBLIC_PATHS:
         await verify_user_id_configured(request)
-        response = await call_next(request)
-        return response
-    except Exception as e:
-        # Log the exception with full traceback
-        logger = logging.getLogger(__name__)
-        logger.error(f"Error in middleware: {e}", exc_info=True)
-        raise
+    return await call_next(request)
 
 
 # Include API routes
@@ -203,13 +267,20 @@ app.include_router(api_router, prefix="/api/v1")
 instrument_app(app)
 
 
+# Constant bodies for the root and health endpoints, encoded once
+_ROOT_BYTES = orjson.dumps(
+    {"message": "Welcome to Rocketlane Assist API", "version": "1.0.0", "docs": "/docs"}
+)
+_HEALTH_BYTES = b'{"status":"healthy"}'
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {"message": "Welcome to Rocketlane Assist API", "version": "1.0.0", "docs": "/docs"}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
@@ -1,20 +1,29 @@
 """Google Calendar integration models."""
-from datetime import datetime
-from typing import Any
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+
+# Datetime serialized with datetime.isoformat() in JSON output
+IsoDatetime = Annotated[datetime, PlainSerializer(datetime.isoformat, when_used="json")]
 
 
 class GoogleCalendarEvent(BaseModel):
     """Model for a Google Calendar event."""
+    # Events are replaced wholesale on sync, never edited in place
+    model_config = ConfigDict(frozen=True)
+
     id: str
     summary: str | None = None
     description: str | None = None
     location: str | None = None
-    start: datetime
-    end: datetime
-    created: datetime | None = None
-    updated: datetime | None = None
+    start: IsoDatetime
+    end: IsoDatetime
+    created: IsoDatetime | None = None
+    updated: IsoDatetime | None = None
     status: str = "confirmed"
     attendees: list[dict[str, Any]] = Field(default_factory=list)
     organizer: dict[str, Any] | None = None
@@ -23,10 +32,45 @@ class GoogleCalendarEvent(BaseModel):
     is_all_day: bool = False
     html_link: str | None = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+
+def _epoch_ms(value: datetime) -> int:
+    """Milliseconds since the epoch, reading naive (all-day) datetimes as UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() * 1000)
+
+
+@dataclass(slots=True)
+class GoogleCalendarEventIndex:
+    """Columnar view of cached events, sorted by start, for time-window lookups.
+
+    Holds only the fields a window scan touches, so lookups compare ints
+    instead of loading every event model.
+    """
+    starts: array = field(default_factory=lambda: array("q"))
+    ends: array = field(default_factory=lambda: array("q"))
+    # Position of each indexed event in the canonical events list
+    positions: list[int] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, events: list["GoogleCalendarEvent"]) -> "GoogleCalendarEventIndex":
+        """Index events by start time"""
+        keyed = sorted(
+            (_epoch_ms(event.start), _epoch_ms(event.end), i) for i, event in enumerate(events)
+        )
+        return cls(
+            starts=array("q", (k[0] for k in keyed)),
+            ends=array("q", (k[1] for k in keyed)),
+            positions=[k[2] for k in keyed],
+        )
+
+    def overlapping(self, start: datetime, end: datetime) -> list[int]:
+        """Positions of events that overlap [start, end), in start order"""
+        window_start = _epoch_ms(start)
+        # Events starting at or after the window end can't overlap it
+        stop = bisect_left(self.starts, _epoch_ms(end))
+        ends = self.ends
+        return [self.positions[i] for i in range(stop) if ends[i] > window_start]
 
 
 class GoogleCalendarAuth(BaseModel):
@@ -37,27 +81,17 @@ class GoogleCalendarAuth(BaseModel):
     client_id: str
     client_secret: str
     scopes: list[str]
-    expiry: datetime | None = None
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    expiry: IsoDatetime | None = None
 
 
 class GoogleCalendarCache(BaseModel):
     """Model for cached Google Calendar data."""
     auth: GoogleCalendarAuth | None = None
     events: list[GoogleCalendarEvent] = Field(default_factory=list)
-    last_synced: datetime | None = None
+    last_synced: IsoDatetime | None = None
     user_email: str | None = None
     calendar_id: str = "primary"
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-
 
 class GoogleCalendarConfig(BaseModel):
     """Configuration for Google Calendar integration."""
@@ -78,13 +112,10 @@ class GoogleCalendarConfig(BaseModel):
 
 class GoogleCalendarStatus(BaseModel):
     """Status response for Google Calendar integration."""
+    model_config = ConfigDict(frozen=True)
+
     is_configured: bool
     is_authenticated: bool
     user_email: str | None = None
     event_count: int = 0
-    last_synced: datetime | None = None
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    last_synced: IsoDatetime | None = None
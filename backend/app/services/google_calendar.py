@@ -1,5 +1,5 @@
 """Google Calendar integration service."""
-import json
+import asyncio
 import os
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -16,19 +16,61 @@ from app.models.google_calendar import (
     GoogleCalendarCache,
     GoogleCalendarConfig,
     GoogleCalendarEvent,
+    GoogleCalendarEventIndex,
     GoogleCalendarStatus,
 )
 
+# Scopes requested when building the auth URL and expected back in the callback
+OAUTH_SCOPES = [
+    "https://www.googleapis.com/auth/calendar.readonly",
+    "https://www.googleapis.com/auth/userinfo.email",
+    "openid"
+]
+
+# Partial-response mask: only the event fields _to_event reads are sent by the API
+EVENT_FIELDS = (
+    "items(id,summary,description,location,start,end,created,updated,status,"
+    "attendees,organizer,recurrence,recurringEventId,htmlLink)"
+)
+
 
 class GoogleCalendarService:
     """Service for managing Google Calendar integration."""
 
     CACHE_FILE = Path("/app/config/google_calendar_cache.json")
+    # Refresh the access token this long before it expires
+    REFRESH_MARGIN = timedelta(minutes=5)
+    # How often the background task calls ensure_fresh
+    PROACTIVE_REFRESH_INTERVAL = timedelta(minutes=5)
+    # A token entering this window is refreshed by the next check, which comes while more
+    # than REFRESH_MARGIN is left, so request paths don't refresh inline while checks succeed
+    PROACTIVE_REFRESH_MARGIN = REFRESH_MARGIN + PROACTIVE_REFRESH_INTERVAL + timedelta(minutes=1)
 
     def __init__(self):
         """Initialize the Google Calendar service."""
         self.config = self._load_config()
+        # OAuth client config, built once since it only depends on the environment
+        self._client_config = {
+            "installed": {
+                "client_id": self.config.client_id,
+                "client_secret": self.config.client_secret,
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "redirect_uris": [self.config.redirect_uri]
+            }
+        }
+        # The in-memory cache is authoritative; changes reach disk on flush()
         self.cache = self._load_cache()
+        self._dirty = False
+        # Credentials built from cache.auth, reused until the token nears expiry
+        self._credentials: Credentials | None = None
+        # In-flight background token refresh, shared by concurrent ensure_fresh() callers
+        self._refresh_task: asyncio.Task | None = None
+        # Set to wake the background sync loop before its next scheduled run
+        self.sync_wake = asyncio.Event()
+        # Time-window index over cache.events, rebuilt when the events list is replaced
+        self._event_index: GoogleCalendarEventIndex | None = None
+        self._indexed_events: list[GoogleCalendarEvent] | None = None
 
     def _load_config(self) -> GoogleCalendarConfig:
         """Load Google Calendar configuration from environment."""
@@ -42,66 +84,49 @@ class GoogleCalendarService:
         """Load cached Google Calendar data from file."""
         if self.CACHE_FILE.exists():
             try:
-                with open(self.CACHE_FILE) as f:
-                    data = json.load(f)
-                    # Convert ISO strings back to datetime objects
-                    if data.get("last_synced"):
-                        data["last_synced"] = datetime.fromisoformat(data["last_synced"])
-                    if data.get("auth") and data["auth"].get("expiry"):
-                        data["auth"]["expiry"] = datetime.fromisoformat(data["auth"]["expiry"])
-                    # Convert event dates
-                    for event in data.get("events", []):
-                        if event.get("start"):
-                            event["start"] = datetime.fromisoformat(event["start"])
-                        if event.get("end"):
-                            event["end"] = datetime.fromisoformat(event["end"])
-                        if event.get("created"):
-                            event["created"] = datetime.fromisoformat(event["created"])
-                        if event.get("updated"):
-                            event["updated"] = datetime.fromisoformat(event["updated"])
-                    return GoogleCalendarCache(**data)
+                # Validation parses the stored ISO timestamps back into datetimes
+                return GoogleCalendarCache.model_validate_json(self.CACHE_FILE.read_bytes())
             except Exception as e:
                 print(f"Error loading Google Calendar cache: {e}")
         return GoogleCalendarCache()
 
-    def _save_cache(self):
-        """Save Google Calendar cache to file."""
+    def _mark_dirty(self):
+        """Record that the in-memory cache has changes not yet written to disk."""
+        self._dirty = True
+
+    def flush(self):
+        """Write the cache to file if it changed since the last flush."""
+        if not self._dirty:
+            return
+        self._dirty = False
         try:
             # Ensure config directory exists
             self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert to dict with ISO format dates
-            cache_dict = self.cache.dict()
-            with open(self.CACHE_FILE, "w") as f:
-                json.dump(cache_dict, f, indent=2, default=str)
+            # Write to temp file first, then rename (atomic operation); flushes are
+            # already batched, so each one can afford to sync the data to disk
+            temp_file = self.CACHE_FILE.with_suffix(".tmp")
+            with open(temp_file, "wb") as f:
+                f.write(self.cache.model_dump_json().encode())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.CACHE_FILE)
         except Exception as e:
+            self._dirty = True
             print(f"Error saving Google Calendar cache: {e}")
 
+    def _build_flow(self) -> Flow:
+        """Create an OAuth flow; a Flow carries per-authorization state, so one per request."""
+        return Flow.from_client_config(
+            self._client_config, scopes=OAUTH_SCOPES, redirect_uri=self.config.redirect_uri
+        )
+
     def get_auth_url(self) -> str | None:
         """Generate OAuth authorization URL."""
         if not self.config.is_configured:
             return None
 
-        # Use the same scopes for auth URL and callback
-        expected_scopes = [
-            "https://www.googleapis.com/auth/calendar.readonly",
-            "https://www.googleapis.com/auth/userinfo.email",
-            "openid"
-        ]
-
-        flow = Flow.from_client_config(
-            {
-                "installed": {
-                    "client_id": self.config.client_id,
-                    "client_secret": self.config.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.config.redirect_uri]
-                }
-            },
-            scopes=expected_scopes,
-            redirect_uri=self.config.redirect_uri
-        )
+        flow = self._build_flow()
 
         auth_url, _ = flow.authorization_url(
             access_type="offline",
@@ -117,26 +142,7 @@ class GoogleCalendarService:
             return False
 
         try:
-            # Create flow with all expected scopes including openid
-            expected_scopes = [
-                "https://www.googleapis.com/auth/calendar.readonly",
-                "https://www.googleapis.com/auth/userinfo.email",
-                "openid"
-            ]
-            
-            flow = Flow.from_client_config(
-                {
-                    "installed": {
-                        "client_id": self.config.client_id,
-                        "client_secret": self.config.client_secret,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "redirect_uris": [self.config.redirect_uri]
-                    }
-                },
-                scopes=expected_scopes,
-                redirect_uri=self.config.redirect_uri
-            )
+            flow = self._build_flow()
 
             # Exchange code for tokens
             flow.fetch_token(code=code)
@@ -157,12 +163,14 @@ class GoogleCalendarService:
             service = build("oauth2", "v2", credentials=credentials)
             user_info = service.userinfo().get().execute()
             self.cache.user_email = user_info.get("email")
+            self._credentials = credentials
 
-            # Save cache
-            self._save_cache()
+            # Credentials are written right away so a restart never loses them
+            self._mark_dirty()
+            self.flush()
 
-            # Initial sync
-            await self.sync_events()
+            # Initial sync runs in the background loop so the redirect isn't held up
+            self.request_sync()
 
             return True
 
@@ -175,31 +183,116 @@ class GoogleCalendarService:
         if not self.cache.auth:
             return None
 
+        credentials = self._credentials
+        if credentials is not None and not self._needs_refresh(credentials):
+            return credentials
+
         try:
-            credentials = Credentials(
-                token=self.cache.auth.access_token,
-                refresh_token=self.cache.auth.refresh_token,
-                token_uri=self.cache.auth.token_uri,
-                client_id=self.cache.auth.client_id,
-                client_secret=self.cache.auth.client_secret,
-                scopes=self.cache.auth.scopes,
-                expiry=self.cache.auth.expiry
-            )
+            if credentials is None:
+                credentials = Credentials(
+                    token=self.cache.auth.access_token,
+                    refresh_token=self.cache.auth.refresh_token,
+                    token_uri=self.cache.auth.token_uri,
+                    client_id=self.cache.auth.client_id,
+                    client_secret=self.cache.auth.client_secret,
+                    scopes=self.cache.auth.scopes,
+                    expiry=self.cache.auth.expiry
+                )
 
-            # Refresh if expired
-            if credentials.expired and credentials.refresh_token:
+            # Refresh if expired or about to expire
+            if self._needs_refresh(credentials) and credentials.refresh_token:
                 credentials.refresh(Request())
                 # Update cache with new token
                 self.cache.auth.access_token = credentials.token
                 self.cache.auth.expiry = credentials.expiry
-                self._save_cache()
+                self._mark_dirty()
 
+            self._credentials = credentials
             return credentials
 
         except Exception as e:
+            self._credentials = None
             print(f"Error getting credentials: {e}")
             return None
 
+    def _needs_refresh(self, credentials: Credentials, margin: timedelta | None = None) -> bool:
+        """Whether the access token expires within margin (REFRESH_MARGIN by default)."""
+        if credentials.expiry is None:
+            return False
+        # google-auth keeps expiry as naive UTC
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return credentials.expiry.replace(tzinfo=None) - now < (margin or self.REFRESH_MARGIN)
+
+    async def ensure_fresh(self):
+        """Refresh the access token in a worker thread if it expires soon.
+
+        Concurrent callers wait on the same refresh.
+        """
+        if self._refresh_task is None:
+            credentials = self._get_credentials()
+            if (
+                not credentials
+                or not credentials.refresh_token
+                or not self._needs_refresh(credentials, self.PROACTIVE_REFRESH_MARGIN)
+            ):
+                return
+            self._refresh_task = asyncio.create_task(self._refresh_credentials(credentials))
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh_credentials(self, credentials: Credentials):
+        """Refresh credentials off the event loop and store the new token."""
+        try:
+            # google-auth refreshes with a blocking HTTP call
+            await asyncio.to_thread(credentials.refresh, Request())
+            # Skip the update if the user disconnected or re-authorized meanwhile
+            if self._credentials is credentials and self.cache.auth:
+                self.cache.auth.access_token = credentials.token
+                self.cache.auth.expiry = credentials.expiry
+                self._mark_dirty()
+        except Exception as e:
+            print(f"Error refreshing credentials: {e}")
+        finally:
+            self._refresh_task = None
+
+    @staticmethod
+    def _to_event(event: dict, updated: datetime | None) -> GoogleCalendarEvent:
+        """Convert a Google Calendar API event to our model."""
+        # fromisoformat accepts the API's trailing "Z" directly on Python 3.11+
+        parse = datetime.fromisoformat
+        start_data = event.get("start", {})
+        end_data = event.get("end", {})
+
+        if "dateTime" in start_data:
+            start = parse(start_data["dateTime"])
+            end = parse(end_data["dateTime"])
+            is_all_day = False
+        else:
+            # All-day event
+            start = parse(start_data["date"])
+            end = parse(end_data["date"])
+            is_all_day = True
+
+        created = event.get("created")
+
+        # Fields are already the right types, so skip re-validating the API's data
+        return GoogleCalendarEvent.model_construct(
+            id=event["id"],
+            summary=event.get("summary"),
+            description=event.get("description"),
+            location=event.get("location"),
+            start=start,
+            end=end,
+            created=parse(created) if created else None,
+            updated=updated,
+            status=event.get("status", "confirmed"),
+            attendees=event.get("attendees", []),
+            organizer=event.get("organizer"),
+            recurrence=event.get("recurrence"),
+            recurring_event_id=event.get("recurringEventId"),
+            is_all_day=is_all_day,
+            html_link=event.get("htmlLink")
+        )
+
     async def sync_events(self) -> bool:
         """Sync calendar events from the last 10 days."""
         credentials = self._get_credentials()
@@ -220,60 +313,29 @@ class GoogleCalendarService:
                 timeMin=ten_days_ago.isoformat(),
                 timeMax=now.isoformat(),
                 singleEvents=True,
-                orderBy="startTime"
+                orderBy="startTime",
+                fields=EVENT_FIELDS
             ).execute()
 
             events = events_result.get("items", [])
 
-            # Convert to our model
+            # Convert to our model, reusing unchanged events so only edits are re-validated
+            previous = {event.id: event for event in self.cache.events}
+            parse = datetime.fromisoformat
             calendar_events = []
             for event in events:
-                # Parse start/end times
-                start_data = event.get("start", {})
-                end_data = event.get("end", {})
-
-                if "dateTime" in start_data:
-                    start = datetime.fromisoformat(start_data["dateTime"])
-                    end = datetime.fromisoformat(end_data["dateTime"])
-                    is_all_day = False
+                updated = parse(event["updated"]) if event.get("updated") else None
+
+                existing = previous.get(event["id"])
+                if existing is not None and updated is not None and existing.updated == updated:
+                    calendar_events.append(existing)
                 else:
-                    # All-day event
-                    start = datetime.fromisoformat(start_data["date"] + "T00:00:00")
-                    end = datetime.fromisoformat(end_data["date"] + "T00:00:00")
-                    is_all_day = True
-
-                # Parse created/updated times
-                created = None
-                if event.get("created"):
-                    created = datetime.fromisoformat(event["created"].replace("Z", "+00:00"))
-
-                updated = None
-                if event.get("updated"):
-                    updated = datetime.fromisoformat(event["updated"].replace("Z", "+00:00"))
-
-                calendar_event = GoogleCalendarEvent(
-                    id=event["id"],
-                    summary=event.get("summary"),
-                    description=event.get("description"),
-                    location=event.get("location"),
-                    start=start,
-                    end=end,
-                    created=created,
-                    updated=updated,
-                    status=event.get("status", "confirmed"),
-                    attendees=event.get("attendees", []),
-                    organizer=event.get("organizer"),
-                    recurrence=event.get("recurrence"),
-                    recurring_event_id=event.get("recurringEventId"),
-                    is_all_day=is_all_day,
-                    html_link=event.get("htmlLink")
-                )
-                calendar_events.append(calendar_event)
+                    calendar_events.append(self._to_event(event, updated))
 
             # Update cache
             self.cache.events = calendar_events
             self.cache.last_synced = now
-            self._save_cache()
+            self._mark_dirty()
 
             return True
 
@@ -284,6 +346,10 @@ class GoogleCalendarService:
             print(f"Error syncing events: {e}")
             return False
 
+    def request_sync(self):
+        """Ask the background sync loop to sync now instead of at its next interval."""
+        self.sync_wake.set()
+
     def get_status(self) -> GoogleCalendarStatus:
         """Get current status of Google Calendar integration."""
         is_authenticated = bool(self.cache.auth and self._get_credentials())
@@ -300,10 +366,21 @@ class GoogleCalendarService:
         """Get cached calendar events."""
         return self.cache.events
 
+    def get_events_between(self, start: datetime, end: datetime) -> list[GoogleCalendarEvent]:
+        """Get cached events overlapping [start, end), ordered by start time."""
+        events = self.cache.events
+        if self._event_index is None or self._indexed_events is not events:
+            self._event_index = GoogleCalendarEventIndex.build(events)
+            self._indexed_events = events
+        return [events[i] for i in self._event_index.overlapping(start, end)]
+
     def disconnect(self):
         """Disconnect Google Calendar integration."""
         self.cache = GoogleCalendarCache()
-        self._save_cache()
+        self._credentials = None
+        # Remove stored credentials from disk immediately
+        self._mark_dirty()
+        self.flush()
 
 
 # Global instance
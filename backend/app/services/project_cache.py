@@ -1,13 +1,24 @@
 """Project membership cache service for efficient filtering"""
 
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
+
 from ..core.config_manager import get_config_manager
 
 
+def _extract_uid(value: Any) -> int | None:
+    """User ID from a member reference (a dict with userId, or a bare ID) as an int"""
+    if isinstance(value, dict):
+        value = value.get("userId")
+    try:
+        return int(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
 class ProjectCacheService:
     """Service for caching project membership data"""
 
@@ -16,127 +27,120 @@ class ProjectCacheService:
         self.cache_dir = os.path.dirname(self.config_manager.config_path)
         self.cache_file = os.path.join(self.cache_dir, "project_cache.json")
         self.cache_ttl = timedelta(hours=1)  # Cache for 1 hour
+        # Parsed file contents, reused until the file's mtime changes
+        self._mem_cache: dict[str, Any] | None = None
+        self._mem_mtime: float = 0.0
+        # last_updated as stored and parsed, so validity checks only parse a new timestamp
+        self._last_updated_raw: str | None = None
+        self._last_updated: datetime | None = None
 
     def _load_cache(self) -> dict[str, Any]:
-        """Load cache from file"""
-        if not os.path.exists(self.cache_file):
+        """Load cache from memory, re-reading the file only when it has changed"""
+        try:
+            mtime = os.stat(self.cache_file).st_mtime
+        except OSError:
+            self._mem_cache = None
             return {"projects": {}, "last_updated": None}
 
+        if self._mem_cache is not None and mtime == self._mem_mtime:
+            return self._mem_cache
+
         try:
-            with open(self.cache_file) as f:
-                return json.load(f)
+            with open(self.cache_file, "rb") as f:
+                self._mem_cache = orjson.loads(f.read())
+            self._mem_mtime = mtime
+            return self._mem_cache
         except Exception:
             return {"projects": {}, "last_updated": None}
 
     def _save_cache(self, cache_data: dict[str, Any]) -> None:
-        """Save cache to file"""
+        """Save cache to file, keeping the written data as the in-memory copy"""
         try:
-            with open(self.cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            # Write to temp file first, then rename (atomic operation)
+            temp_file = self.cache_file + ".tmp"
+            with open(temp_file, "wb") as f:
+                f.write(orjson.dumps(cache_data))
+            os.replace(temp_file, self.cache_file)
+            self._mem_cache = cache_data
+            self._mem_mtime = os.stat(self.cache_file).st_mtime
         except Exception as e:
             print(f"Failed to save project cache: {e}")
 
-    def is_cache_valid(self) -> bool:
-        """Check if cache is still valid"""
-        cache_data = self._load_cache()
-        if not cache_data["last_updated"]:
+    def is_cache_valid(self, cache_data: dict[str, Any] | None = None) -> bool:
+        """Check if cache is still valid, optionally for already loaded cache data"""
+        if cache_data is None:
+            cache_data = self._load_cache()
+        # Files written before the by_user index (with string member IDs) must be rebuilt
+        if "by_user" not in cache_data:
+            return False
+        raw = cache_data["last_updated"]
+        if not raw:
             return False
 
-        last_updated = datetime.fromisoformat(cache_data["last_updated"])
-        return datetime.now() - last_updated < self.cache_ttl
+        if raw != self._last_updated_raw:
+            self._last_updated = datetime.fromisoformat(raw)
+            self._last_updated_raw = raw
+        return datetime.now() - self._last_updated < self.cache_ttl
 
     def get_project_members(self, project_id: int) -> dict[str, list[int]] | None:
         """Get cached project members"""
-        if not self.is_cache_valid():
+        # One load serves both the validity check and the lookup
+        cache_data = self._load_cache()
+        if not self.is_cache_valid(cache_data):
             return None
 
-        cache_data = self._load_cache()
         return cache_data["projects"].get(str(project_id))
 
     def update_project_cache(self, projects: list[dict[str, Any]]) -> None:
         """Update the project cache with membership data"""
+        # Reverse index so per-user lookups don't scan every project's members
+        by_user: dict[str, list[str]] = {}
         cache_data: dict[str, Any] = {
             "projects": {},
+            "by_user": by_user,
             "last_updated": datetime.now().isoformat(),
         }
 
         for project in projects:
             project_id = str(project.get("projectId"))
 
-            # Extract all types of members from the project
-            members: dict[str, list[str]] = {
-                "team_members": [],
-                "solution_architects": [],
-                "all_members": [],
-            }
+            # Sets keep each source linear however many members overlap
+            # IDs are stored as ints, so the same user given as 5 and "5" is one member
+            team: set[int] = set()
+            architects: set[int] = set()
+            all_members: set[int] = set()
 
             # Team members
             team_members = project.get("teamMembers", {}).get("members", [])
-            for member in team_members:
-                user_id = member.get("userId")
-                if user_id:
-                    members["team_members"].append(user_id)
-                    members["all_members"].append(user_id)
+            team.update(filter(None, map(_extract_uid, team_members)))
 
             # Solution Architects (check various possible fields)
             # Check for solutionArchitects field
             solution_architects = project.get("solutionArchitects", [])
             if isinstance(solution_architects, list):
-                for sa in solution_architects:
-                    if isinstance(sa, dict):
-                        user_id = sa.get("userId")
-                        if user_id:
-                            members["solution_architects"].append(user_id)
-                            if user_id not in members["all_members"]:
-                                members["all_members"].append(user_id)
-                    elif isinstance(sa, int):
-                        sa_str = str(sa)
-                        members["solution_architects"].append(sa_str)
-                        if sa_str not in members["all_members"]:
-                            members["all_members"].append(sa_str)
+                architects.update(filter(None, map(_extract_uid, solution_architects)))
 
             # Check for solutionArchitect field (singular)
-            solution_architect = project.get("solutionArchitect")
-            if solution_architect:
-                if isinstance(solution_architect, dict):
-                    user_id = solution_architect.get("userId")
-                    if user_id and user_id not in members["solution_architects"]:
-                        members["solution_architects"].append(user_id)
-                        if user_id not in members["all_members"]:
-                            members["all_members"].append(user_id)
-                elif isinstance(solution_architect, int):
-                    sa_str = str(solution_architect)
-                    if sa_str not in members["solution_architects"]:
-                        members["solution_architects"].append(sa_str)
-                        if sa_str not in members["all_members"]:
-                            members["all_members"].append(sa_str)
-
-            # Check for other possible member fields
-            # Project owner
-            owner = project.get("owner")
-            if owner:
-                if isinstance(owner, dict):
-                    user_id = owner.get("userId")
-                    if user_id and user_id not in members["all_members"]:
-                        members["all_members"].append(user_id)
-                elif isinstance(owner, int):
-                    owner_str = str(owner)
-                    if owner_str not in members["all_members"]:
-                        members["all_members"].append(owner_str)
-
-            # Created by
-            created_by = project.get("createdBy")
-            if created_by:
-                if isinstance(created_by, dict):
-                    user_id = created_by.get("userId")
-                    if user_id and user_id not in members["all_members"]:
-                        members["all_members"].append(user_id)
-                elif isinstance(created_by, int):
-                    created_by_str = str(created_by)
-                    if created_by_str not in members["all_members"]:
-                        members["all_members"].append(created_by_str)
+            user_id = _extract_uid(project.get("solutionArchitect"))
+            if user_id:
+                architects.add(user_id)
 
+            all_members.update(team, architects)
+
+            # Check for other possible member fields: project owner and creator
+            for field in ("owner", "createdBy"):
+                user_id = _extract_uid(project.get(field))
+                if user_id:
+                    all_members.add(user_id)
+
+            members: dict[str, list[int]] = {
+                "team_members": sorted(team),
+                "solution_architects": sorted(architects),
+                "all_members": sorted(all_members),
+            }
             cache_data["projects"][project_id] = members
+            for user_id in all_members:
+                by_user.setdefault(str(user_id), []).append(project_id)
 
         self._save_cache(cache_data)
 
@@ -145,26 +149,23 @@ class ProjectCacheService:
     ) -> list[dict[str, Any]]:
         """Get projects where user is a member (any role)"""
         # First, update cache if needed
-        if not self.is_cache_valid():
-            self.update_project_cache(projects)
-
         cache_data = self._load_cache()
-        user_projects = []
-
-        for project in projects:
-            project_id = str(project.get("projectId"))
-            project_members = cache_data["projects"].get(project_id, {})
-
-            # Check if user is in any member list
-            if user_id in project_members.get("all_members", []):
-                user_projects.append(project)
+        if not self.is_cache_valid(cache_data):
+            self.update_project_cache(projects)
+            cache_data = self._load_cache()
 
-        return user_projects
+        by_pid = {str(project.get("projectId")): project for project in projects}
+        return [
+            by_pid[project_id]
+            for project_id in cache_data.get("by_user", {}).get(str(user_id), [])
+            if project_id in by_pid
+        ]
 
     def clear_cache(self) -> None:
         """Clear the cache file"""
         if os.path.exists(self.cache_file):
             try:
                 os.remove(self.cache_file)
+                self._mem_cache = None
             except Exception as e:
                 print(f"Failed to clear project cache: {e}")
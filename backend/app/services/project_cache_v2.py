@@ -8,7 +8,12 @@ from typing import Any
 import httpx
 
 from ..core.cache import BaseCache, CacheConfig
-from .rocketlane import RocketlaneClient
+from .rocketlane import (
+    RocketlaneClient,
+    get_rocketlane_client,
+    get_rocketlane_http_client,
+    parse_json,
+)
 
 
 class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
@@ -23,14 +28,16 @@ class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
             enable_background_refresh=True
         )
         super().__init__(config, "projects")
-        self.client = None
         self.fetch_timeout = 30.0  # Increased timeout for bulk fetches
+        # Lookups over the last project list seen, rebuilt when the list object changes:
+        # userId -> projects they're a team member of, and projectId -> project
+        self._member_index: dict[Any, list[dict[str, Any]]] = {}
+        self._projects_by_id: dict[str, dict[str, Any]] = {}
+        self._indexed_projects: list[dict[str, Any]] | None = None
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     async def _fetch_projects_with_retry(self) -> list[dict[str, Any]]:
         """Fetch all projects with retry logic and proper pagination handling"""
@@ -60,80 +67,79 @@ class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
         page_count = 0
         max_pages = 20  # Safety limit
 
-        # Create a custom httpx client with longer timeout
-        async with httpx.AsyncClient(timeout=httpx.Timeout(self.fetch_timeout)) as http_client:
-            while page_count < max_pages:
-                try:
-                    params = {"pageSize": 100}
-                    if page_token:
-                        params["pageToken"] = page_token
-
-                    url = f"{client.base_url}/projects"
-                    self.logger.info(f"Fetching projects page {page_count + 1} (token: {page_token})")
-
-                    response = await http_client.get(
-                        url,
-                        headers=client.headers,
-                        params=params
-                    )
-
-                    # Check for specific error conditions
-                    if response.status_code == 401:
-                        raise ValueError("Invalid Rocketlane API key")
-                    elif response.status_code == 403:
-                        raise ValueError("Access forbidden - check API key permissions")
-                    elif response.status_code == 429:
-                        # Rate limited - wait and retry
-                        retry_after = int(response.headers.get("Retry-After", "60"))
-                        self.logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    response.raise_for_status()
-                    data = response.json()
-
-                    # Handle different response structures
-                    if isinstance(data, list):
-                        all_projects.extend(data)
-                        break  # No pagination
-                    elif "data" in data:
-                        all_projects.extend(data["data"])
-
-                        # Check for pagination
-                        pagination = data.get("pagination", {})
-                        if not pagination.get("hasMore", False):
-                            break
-                        page_token = pagination.get("nextPageToken")
-
-                        if not page_token:
-                            break
-                    elif "projects" in data:
-                        all_projects.extend(data["projects"])
-                        break  # Assume no pagination
-                    else:
-                        self.logger.warning(f"Unexpected response structure: {data.keys()}")
-                        break
+        # Shared pooled client; bulk fetches get a longer per-request timeout
+        http_client = get_rocketlane_http_client()
+        while page_count < max_pages:
+            try:
+                params = {"pageSize": 100}
+                if page_token:
+                    params["pageToken"] = page_token
 
-                    page_count += 1
+                url = f"{client.base_url}/projects"
+                self.logger.info(f"Fetching projects page {page_count + 1} (token: {page_token})")
 
-                    # Small delay between pages to avoid rate limiting
-                    if page_token:
-                        await asyncio.sleep(0.5)
+                response = await http_client.get(
+                    url,
+                    headers=client.headers,
+                    params=params,
+                    timeout=self.fetch_timeout,
+                )
 
-                except httpx.TimeoutException as e:
-                    self.logger.error(f"Timeout fetching projects page {page_count + 1}: {e}")
-                    if page_count > 0:
-                        # We have some data, return what we have
-                        self.logger.warning(f"Returning partial results: {len(all_projects)} projects")
-                        return all_projects
-                    raise
-                except Exception as e:
-                    self.logger.error(f"Error fetching projects page {page_count + 1}: {e}")
-                    if page_count > 0:
-                        # We have some data, return what we have
-                        self.logger.warning(f"Returning partial results: {len(all_projects)} projects")
-                        return all_projects
-                    raise
+                # Check for specific error conditions
+                if response.status_code == 401:
+                    raise ValueError("Invalid Rocketlane API key")
+                elif response.status_code == 403:
+                    raise ValueError("Access forbidden - check API key permissions")
+                elif response.status_code == 429:
+                    # Rate limited - wait and retry
+                    retry_after = int(response.headers.get("Retry-After", "60"))
+                    self.logger.warning(f"Rate limited, waiting {retry_after} seconds")
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                response.raise_for_status()
+                data = parse_json(response)
+
+                # Handle different response structures
+                if isinstance(data, list):
+                    all_projects.extend(data)
+                    break  # No pagination
+                elif "data" in data:
+                    all_projects.extend(data["data"])
+
+                    # Check for pagination
+                    pagination = data.get("pagination", {})
+                    if not pagination.get("hasMore", False):
+                        break
+                    page_token = pagination.get("nextPageToken")
+
+                    if not page_token:
+                        break
+                elif "projects" in data:
+                    all_projects.extend(data["projects"])
+                    break  # Assume no pagination
+                else:
+                    self.logger.warning(f"Unexpected response structure: {data.keys()}")
+                    break
+
+                # Pages are token-chained, so the next request starts as soon as this one
+                # returns; a 429 above waits out Retry-After instead of a fixed delay
+                page_count += 1
+
+            except httpx.TimeoutException as e:
+                self.logger.error(f"Timeout fetching projects page {page_count + 1}: {e}")
+                if page_count > 0:
+                    # We have some data, return what we have
+                    self.logger.warning(f"Returning partial results: {len(all_projects)} projects")
+                    return all_projects
+                raise
+            except Exception as e:
+                self.logger.error(f"Error fetching projects page {page_count + 1}: {e}")
+                if page_count > 0:
+                    # We have some data, return what we have
+                    self.logger.warning(f"Returning partial results: {len(all_projects)} projects")
+                    return all_projects
+                raise
 
         self.logger.info(f"Successfully fetched {len(all_projects)} projects in {page_count} pages")
         return all_projects
@@ -155,20 +161,36 @@ class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
         # Get all projects
         all_projects = await self.get_all_projects(force_refresh)
 
-        # Filter projects where user is a team member
-        user_projects = []
-        for project in all_projects:
-            # Check teamMembers field (this is what the API returns)
-            team_members = project.get("teamMembers", {})
-            if team_members:
-                member_list = team_members.get("members", [])
-                # Check if user is in the members list
-                if any(member.get("userId") == user_id for member in member_list):
-                    user_projects.append(project)
+        self._index_projects(all_projects)
+        # Copy so callers can reorder their result without touching the index
+        user_projects = list(self._member_index.get(user_id, ()))
 
         self.logger.info(f"User {user_id} is a member of {len(user_projects)} out of {len(all_projects)} projects")
         return user_projects
 
+    def _index_projects(self, projects: list[dict[str, Any]]):
+        """Rebuild the lookup indexes if projects isn't the list they were built from"""
+        if self._indexed_projects is projects:
+            return
+        self._member_index = self._build_member_index(projects)
+        # Built back to front so the first project with a given ID wins, as a scan would
+        self._projects_by_id = {str(p.get("projectId")): p for p in reversed(projects)}
+        self._indexed_projects = projects
+
+    @staticmethod
+    def _build_member_index(
+        projects: list[dict[str, Any]]
+    ) -> dict[Any, list[dict[str, Any]]]:
+        """Map each team member's userId to the projects they belong to, in list order"""
+        index: dict[Any, list[dict[str, Any]]] = {}
+        for project in projects:
+            # Check teamMembers field (this is what the API returns)
+            members = (project.get("teamMembers") or {}).get("members", [])
+            # A user listed twice in one project still gets the project once
+            for user_id in dict.fromkeys(member.get("userId") for member in members):
+                index.setdefault(user_id, []).append(project)
+        return index
+
     async def warm_cache(self):
         """Pre-warm the cache with project data (if not already cached)"""
         try:
@@ -210,10 +232,8 @@ class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
             # This is a sync method, caller should provide projects
             return None
 
-        for project in projects:
-            if str(project.get("projectId")) == str(project_id):
-                return project
-        return None
+        self._index_projects(projects)
+        return self._projects_by_id.get(str(project_id))
 
     async def get_project_details(
         self,
@@ -221,23 +241,28 @@ class ProjectCacheService(BaseCache[list[dict[str, Any]]]):
         force_refresh: bool = False
     ) -> dict[str, Any] | None:
         """Get detailed project information"""
-        # First try to get from cached list
-        all_projects = await self.get_all_projects(force_refresh)
+        # First try the cached list; without a fetch function, get() never pages the API
+        if force_refresh:
+            all_projects = await self.get_all_projects(force_refresh=True)
+        else:
+            all_projects = await self.get("all_projects") or []
         project = self.get_project_by_id(project_id, all_projects)
 
         if project:
             return project
 
-        # If not found in cache, fetch directly (might be a new project)
+        # If not found in cache, fetch just this project (might be a new project)
         try:
             client = self._get_client()
-            async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as http_client:
-                response = await http_client.get(
-                    f"{client.base_url}/projects/{project_id}",
-                    headers=client.headers
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await get_rocketlane_http_client().get(
+                f"{client.base_url}/projects/{project_id}",
+                headers=client.headers,
+                timeout=10.0,
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return parse_json(response)
         except Exception as e:
             self.logger.error(f"Error fetching project {project_id}: {e}")
             return None
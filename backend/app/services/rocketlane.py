@@ -1,27 +1,99 @@
 import asyncio
-import json
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 
 from ..core.config import settings
 from ..core.logging import get_logger, log_request_details, log_response_details
 
+# Task status names accepted by get_tasks, mapped to Rocketlane status values
+_STATUS_VALUES = {
+    "todo": 1,
+    "to_do": 1,
+    "not_done": 1,
+    "in_progress": 2,
+    "completed": 3,
+    "done": 3,
+}
+
+
+# Methods that are safe to resend after a server error
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+
+def _task_status(task: dict[str, Any]) -> Any:
+    """A task's status value; the API gives either a dict with a value or the value itself"""
+    status = task.get("status")
+    return status.get("value") if isinstance(status, dict) else status
+
+
+def _task_matches(task: dict[str, Any], status: Any, user_id: str | None) -> bool:
+    """Whether a task has the given status value and user_id among its assignees.
+
+    A None status or user_id matches any task.
+    """
+    if status is not None and _task_status(task) != status:
+        return False
+    if user_id is None:
+        return True
+    return any(
+        str(assignee.get("userId")) == user_id
+        for assignee in task.get("assignees", [])
+        if isinstance(assignee, dict)
+    )
+
+
+def _extract_records(data: Any, key: str) -> list[dict[str, Any]]:
+    """Records from a list response: a bare list, or a list under "data" or key"""
+    if isinstance(data, list):
+        return data
+    if "data" in data:
+        return data["data"]
+    return data.get(key, [])
+
+
+def _extract_page(data: Any, key: str) -> tuple[list[dict[str, Any]], str | None]:
+    """Records from one page of a list response, and the next page's token if there is one"""
+    records = _extract_records(data, key)
+    if isinstance(data, list):
+        return records, None
+    pagination = data.get("pagination") or {}
+    return records, pagination.get("nextPageToken") if pagination.get("hasMore") else None
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson instead of the stdlib parser"""
+    return orjson.loads(response.content)
+
 
 class RocketlaneClient:
     """Client for interacting with Rocketlane API"""
 
+    # Cleared for the rest of the process if the API rejects a status.eq task filter
+    _status_filter_works = True
+
     def __init__(self, api_key: str | None = None, base_url: str | None = None):
         self.logger = get_logger(__name__)
         self.api_key = api_key or settings.rocketlane_api_key
         self.base_url = base_url or settings.rocketlane_api_base_url
+        # GETs carry no body, so only requests with a JSON body send Content-Type
         self.headers = {
             "api-key": self.api_key,
             "accept": "application/json",
-            "Content-Type": "application/json",
         }
+        self.json_headers = {**self.headers, "Content-Type": "application/json"}
         self.max_retries = 3
         self.initial_retry_delay = 1.0  # seconds
+        self.max_backoff = 30.0  # seconds, cap for the jittered backoff
+        # Single-record lookups that rarely change: key -> (expires_at, response)
+        self.response_ttl = 60.0  # seconds
+        self._responses: dict[tuple[str, str], tuple[float, Any]] = {}
 
         # Validate configuration
         if not self.api_key:
@@ -30,29 +102,82 @@ class RocketlaneClient:
 
         self.logger.debug(f"RocketlaneClient initialized with base_url: {self.base_url}")
 
-    async def _handle_rate_limiting(self, response: httpx.Response, attempt: int = 0) -> bool:
-        """Handle rate limiting with exponential backoff.
-        
-        Returns True if request should be retried, False otherwise.
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """The pooled HTTP client shared by all Rocketlane API calls"""
+        return get_rocketlane_http_client()
+
+    def _log_response(self, response: httpx.Response):
+        """Log a response at debug level, decoding the body only when debug logging is on"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # log_response_details keeps 1000 characters; one more lets it mark the truncation
+            body = response.content[:1001].decode(errors="replace")
+            log_response_details(self.logger, response.status_code, body)
+
+    async def warm_up(self):
+        """Open a pooled connection to the API ahead of the first real request.
+
+        Any response (or failure) is fine; only the established connection matters.
+        """
+        try:
+            await self._http.head(
+                f"{self.base_url}/projects", headers=self.headers, params={"pageSize": 1}
+            )
+        except httpx.HTTPError as e:
+            self.logger.debug(f"Rocketlane connection warm-up failed: {e}")
+
+    async def _cached_response(
+        self, key: tuple[str, str], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a response fetched within the last response_ttl seconds, or fetch it"""
+        now = time.monotonic()
+        hit = self._responses.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+
+        data = await fetch()
+        if len(self._responses) >= 512:
+            # Drop expired entries before the cache grows further
+            self._responses = {k: v for k, v in self._responses.items() if v[0] > now}
+        self._responses[key] = (now + self.response_ttl, data)
+        return data
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, with jitter so clients don't retry in lockstep"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            # Honour the server's delay, plus up to a second of spread
+            return int(retry_after) + random.uniform(0, 1.0)
+        # Full jitter: anywhere up to the capped exponential delay
+        return random.uniform(0, min(self.max_backoff, self.initial_retry_delay * (2 ** attempt)))
+
+    async def _request(
+        self, method: str, url: str, *, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request over the pooled client, retrying rate limits and server errors.
+
+        429s are retried for any method; 5xx only for idempotent ones, so a POST that may
+        have been applied is never resent. Once retries run out the last response is
+        returned for the caller to check.
         """
-        if response.status_code == 429:
-            if attempt >= self.max_retries:
-                self.logger.error(f"Max retries ({self.max_retries}) exceeded for rate limiting")
-                return False
-
-            # Check for Retry-After header
-            retry_after = response.headers.get("Retry-After")
-            if retry_after:
-                wait_time = int(retry_after)
-            else:
-                # Exponential backoff
-                wait_time = self.initial_retry_delay * (2 ** attempt)
-
-            self.logger.warning(f"Rate limited. Waiting {wait_time} seconds before retry (attempt {attempt + 1}/{self.max_retries})")
+        client = self._http
+        headers = headers or self.headers
+        for attempt in range(self.max_retries + 1):
+            response = await client.request(method, url, headers=headers, **kwargs)
+            status = response.status_code
+            if not (status == 429 or (status >= 500 and method in _IDEMPOTENT_METHODS)):
+                return response
+            if attempt == self.max_retries:
+                self.logger.error(f"Max retries ({self.max_retries}) exceeded for {method} {url}")
+                return response
+
+            wait_time = self._retry_delay(response, attempt)
+            self.logger.warning(
+                f"{method} {url} returned {status}. Waiting {wait_time:.1f} seconds "
+                f"before retry (attempt {attempt + 1}/{self.max_retries})"
+            )
             await asyncio.sleep(wait_time)
-            return True
-
-        return False
+        return response
 
     async def get_projects(self, limit: int = 100) -> list[dict[str, Any]]:
         """Get all projects with pagination support"""
@@ -60,51 +185,31 @@ class RocketlaneClient:
         page_token = None
 
         try:
-            async with httpx.AsyncClient() as client:
-                while True:
-                    params = {"pageSize": limit}
-                    if page_token:
-                        params["pageToken"] = page_token
-
-                    url = f"{self.base_url}/projects"
-                    log_request_details(self.logger, "GET", url, self.headers, params)
-
-                    response = await client.get(url, headers=self.headers, params=params)
-
-                    log_response_details(self.logger, response.status_code, response.text)
-
-                    # Check for specific error conditions
-                    if response.status_code == 401:
-                        self.logger.error("Authentication failed - check API key")
-                        raise ValueError("Invalid Rocketlane API key")
-                    elif response.status_code == 403:
-                        self.logger.error("Access forbidden - check API permissions")
-                        raise ValueError("Access forbidden - check API key permissions")
-
-                    response.raise_for_status()
-                    data = response.json()
-
-                    # Handle different response structures
-                    if isinstance(data, list):
-                        all_projects.extend(data)
-                        break  # No pagination
-                    elif "data" in data:
-                        all_projects.extend(data["data"])
-
-                        # Check for pagination
-                        pagination = data.get("pagination", {})
-                        if not pagination.get("hasMore", False):
-                            break
-                        page_token = pagination.get("nextPageToken")
-
-                        # Safety check
-                        if not page_token:
-                            break
-                    elif "projects" in data:
-                        all_projects.extend(data["projects"])
-                        break  # Assume no pagination
-                    else:
-                        break
+            while True:
+                params = {"pageSize": limit}
+                if page_token:
+                    params["pageToken"] = page_token
+
+                url = f"{self.base_url}/projects"
+                log_request_details(self.logger, "GET", url, self.headers, params)
+
+                response = await self._request("GET", url, params=params)
+
+                self._log_response(response)
+
+                # Check for specific error conditions
+                if response.status_code == 401:
+                    self.logger.error("Authentication failed - check API key")
+                    raise ValueError("Invalid Rocketlane API key")
+                elif response.status_code == 403:
+                    self.logger.error("Access forbidden - check API permissions")
+                    raise ValueError("Access forbidden - check API key permissions")
+
+                response.raise_for_status()
+                projects, page_token = _extract_page(parse_json(response), "projects")
+                all_projects.extend(projects)
+                if not page_token:
+                    break
 
             self.logger.info(f"Successfully fetched {len(all_projects)} projects")
             return all_projects
@@ -118,12 +223,12 @@ class RocketlaneClient:
 
     async def get_project(self, project_id: str) -> dict[str, Any]:
         """Get details of a specific project"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/projects/{project_id}", headers=self.headers
-            )
+        async def fetch() -> dict[str, Any]:
+            response = await self._request("GET", f"{self.base_url}/projects/{project_id}")
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
+
+        return await self._cached_response(("project", str(project_id)), fetch)
 
     async def get_tasks(
         self,
@@ -132,7 +237,10 @@ class RocketlaneClient:
         user_id: str | None = None,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        """Get tasks, optionally filtered by project, status, and assigned user"""
+        """Get tasks, optionally filtered by project, status, and assigned user.
+
+        limit is the page size; every page of matching tasks is fetched.
+        """
         params: dict[str, Any] = {"pageSize": limit}
 
         # According to Rocketlane API docs, filters should be individual query parameters
@@ -143,72 +251,52 @@ class RocketlaneClient:
         if user_id:
             params["assignees.cn"] = user_id
 
-        # Note: Status filtering seems to cause issues when combined with other filters
-        # We'll handle status filtering in the response if needed
+        # Filter status server-side unless the API has rejected that filter this session
+        status_value = _STATUS_VALUES.get(status.lower(), status) if status else None
+        push_status = status_value is not None and RocketlaneClient._status_filter_works
+        if push_status:
+            params["status.eq"] = status_value
 
         url = f"{self.base_url}/tasks"
-        log_request_details(self.logger, "GET", url, self.headers, params)
+        tasks: list[dict[str, Any]] = []
+        page_token = None
+        while True:
+            if page_token:
+                params["pageToken"] = page_token
+            log_request_details(self.logger, "GET", url, self.headers, params)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
+            response = await self._request("GET", url, params=params)
 
-            log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
+            self._log_response(response)
 
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract tasks from response
-            tasks = []
-            if isinstance(data, list):
-                tasks = data
-            elif "data" in data:
-                tasks = data["data"]
-            elif "tasks" in data:
-                tasks = data["tasks"]
-
-            # Apply status filtering on the response if needed
-            if status and tasks:
-                status_map = {
-                    "todo": 1,
-                    "to_do": 1,
-                    "not_done": 1,
-                    "in_progress": 2,
-                    "completed": 3,
-                    "done": 3,
-                }
-                status_value = status_map.get(status.lower(), status)
-
-                # Filter tasks by status value
-                filtered_tasks = []
-                for task in tasks:
-                    task_status = task.get("status")
-                    if task_status:
-                        # Check if status is a dict with value or direct value
-                        if isinstance(task_status, dict):
-                            if task_status.get("value") == status_value:
-                                filtered_tasks.append(task)
-                        elif task_status == status_value:
-                            filtered_tasks.append(task)
-                return filtered_tasks
-
-            # Apply user filtering on the response if needed (when project_id is also specified)
-            if user_id and project_id and tasks:
-                filtered_tasks = []
-                for task in tasks:
-                    assignees = task.get("assignees", [])
-                    # Check if user is in assignees list
-                    if any(str(assignee.get("userId")) == str(user_id) for assignee in assignees if isinstance(assignee, dict)):
-                        filtered_tasks.append(task)
-                return filtered_tasks
+            if push_status and response.status_code == 400 and page_token is None:
+                self.logger.warning(
+                    "Rocketlane rejected the status.eq task filter; filtering status locally"
+                )
+                RocketlaneClient._status_filter_works = False
+                push_status = False
+                del params["status.eq"]
+                continue
 
+            response.raise_for_status()
+            page, page_token = _extract_page(parse_json(response), "tasks")
+            tasks.extend(page)
+            if not page_token:
+                break
+
+        # Filter whatever the API didn't: status when it wasn't sent, and the assignee when
+        # project_id is also specified, in one pass
+        want_status = None if push_status else status_value
+        want_user = str(user_id) if user_id and project_id else None
+        if want_status is None and want_user is None:
             return tasks
+        return [task for task in tasks if _task_matches(task, want_status, want_user)]
 
     async def get_task(self, task_id: str) -> dict[str, Any]:
         """Get details of a specific task"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.base_url}/tasks/{task_id}", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", f"{self.base_url}/tasks/{task_id}")
+        response.raise_for_status()
+        return parse_json(response)
 
     async def get_project_tasks(
         self, project_id: str, status: str | None = None, user_id: str | None = None
@@ -241,12 +329,14 @@ class RocketlaneClient:
         if category_id:
             payload["categoryId"] = category_id
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/time-entries", headers=self.headers, json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request(
+            "POST",
+            f"{self.base_url}/time-entries",
+            headers=self.json_headers,
+            content=orjson.dumps(payload),
+        )
+        response.raise_for_status()
+        return parse_json(response)
 
     async def get_time_entries(
         self,
@@ -270,62 +360,46 @@ class RocketlaneClient:
         if date_to:
             params["date.le"] = date_to
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/time-entries/search", headers=self.headers, params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            # Handle different response structures
-            if isinstance(data, list):
-                return data
-            elif "data" in data:
-                return data["data"]
-            elif "timeEntries" in data:
-                return data["timeEntries"]
-            return []
+        response = await self._request(
+            "GET", f"{self.base_url}/time-entries/search", params=params
+        )
+        response.raise_for_status()
+        data = parse_json(response)
+        return _extract_records(data, "timeEntries")
 
     async def get_user(self, user_id: str) -> dict[str, Any]:
         """Get a specific user by ID"""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/users/{user_id}"
-            response = await client.get(url, headers=self.headers)
+        async def fetch() -> dict[str, Any]:
+            response = await self._request("GET", f"{self.base_url}/users/{user_id}")
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
+
+        return await self._cached_response(("user", str(user_id)), fetch)
 
     async def get_users(self, limit: int = 100) -> list[dict[str, Any]]:
         """Get users from Rocketlane with specified limit"""
         params = {"pageSize": limit}
 
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/users"
-                log_request_details(self.logger, "GET", url, self.headers, params)
-
-                response = await client.get(url, headers=self.headers, params=params)
+            url = f"{self.base_url}/users"
+            log_request_details(self.logger, "GET", url, self.headers, params)
 
-                log_response_details(self.logger, response.status_code, response.text)
+            response = await self._request("GET", url, params=params)
 
-                # Check for specific error conditions
-                if response.status_code == 401:
-                    self.logger.error("Authentication failed - check API key")
-                    raise ValueError("Invalid Rocketlane API key")
-                elif response.status_code == 403:
-                    self.logger.error("Access forbidden - check API permissions")
-                    raise ValueError("Access forbidden - check API key permissions")
+            self._log_response(response)
 
-                response.raise_for_status()
-                data = response.json()
+            # Check for specific error conditions
+            if response.status_code == 401:
+                self.logger.error("Authentication failed - check API key")
+                raise ValueError("Invalid Rocketlane API key")
+            elif response.status_code == 403:
+                self.logger.error("Access forbidden - check API permissions")
+                raise ValueError("Access forbidden - check API key permissions")
 
-                # Handle different response structures
-                if isinstance(data, list):
-                    return data
-                elif "data" in data:
-                    return data["data"]
-                elif "users" in data:
-                    return data["users"]
+            response.raise_for_status()
+            data = parse_json(response)
 
-                return []
+            return _extract_records(data, "users")
 
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error fetching users: {e}")
@@ -337,35 +411,17 @@ class RocketlaneClient:
     async def get_time_entry_categories(self) -> list[dict[str, Any]]:
         """Get all time entry categories."""
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/time-entries/categories"
-                log_request_details(self.logger, "GET", url, self.headers, {})
+            url = f"{self.base_url}/time-entries/categories"
+            log_request_details(self.logger, "GET", url, self.headers, {})
 
-                attempt = 0
-                while attempt <= self.max_retries:
-                    response = await client.get(url, headers=self.headers)
+            response = await self._request("GET", url)
 
-                    # Handle rate limiting
-                    if await self._handle_rate_limiting(response, attempt):
-                        attempt += 1
-                        continue
-
-                    log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
-                    response.raise_for_status()
-
-                    data = response.json()
+            self._log_response(response)
+            response.raise_for_status()
 
-                    # Handle different response structures
-                    if isinstance(data, list):
-                        return data
-                    elif "data" in data:
-                        return data["data"]
-                    elif "categories" in data:
-                        return data["categories"]
-                    return []
+            data = parse_json(response)
 
-                # If we get here, max retries exceeded
-                raise httpx.HTTPError("Max retries exceeded for time entry categories")
+            return _extract_records(data, "categories")
 
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error fetching time entry categories: {e}")
@@ -385,50 +441,21 @@ class RocketlaneClient:
             all_tasks = []
             page_token = None
 
-            async with httpx.AsyncClient() as client:
-                while True:
-                    if page_token:
-                        params["pageToken"] = page_token
+            while True:
+                if page_token:
+                    params["pageToken"] = page_token
 
-                    url = f"{self.base_url}/tasks"
-                    log_request_details(self.logger, "GET", url, self.headers, params)
-
-                    attempt = 0
-                    while attempt <= self.max_retries:
-                        response = await client.get(url, headers=self.headers, params=params)
-
-                        # Handle rate limiting
-                        if await self._handle_rate_limiting(response, attempt):
-                            attempt += 1
-                            continue
-
-                        break
-
-                    log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
-                    response.raise_for_status()
-
-                    data = response.json()
-
-                    # Extract tasks from response
-                    if isinstance(data, list):
-                        all_tasks.extend(data)
-                        break  # No pagination
-                    elif "data" in data:
-                        all_tasks.extend(data["data"])
+                url = f"{self.base_url}/tasks"
+                log_request_details(self.logger, "GET", url, self.headers, params)
 
-                        # Check for pagination
-                        pagination = data.get("pagination", {})
-                        if not pagination.get("hasMore", False):
-                            break
-                        page_token = pagination.get("nextPageToken")
+                response = await self._request("GET", url, params=params)
 
-                        if not page_token:
-                            break
-                    elif "tasks" in data:
-                        all_tasks.extend(data["tasks"])
-                        break
-                    else:
-                        break
+                self._log_response(response)
+                response.raise_for_status()
+                tasks, page_token = _extract_page(parse_json(response), "tasks")
+                all_tasks.extend(tasks)
+                if not page_token:
+                    break
 
             self.logger.info(f"Fetched {len(all_tasks)} tasks for project {project_id}")
             return all_tasks
@@ -440,6 +467,21 @@ class RocketlaneClient:
             self.logger.error(f"Unexpected error fetching tasks for project {project_id}: {e}")
             raise
 
+    async def get_tasks_by_projects(
+        self, project_ids: list[str], max_concurrency: int = 8
+    ) -> list[list[dict[str, Any]] | BaseException]:
+        """Get all tasks for several projects concurrently over the shared connection pool.
+
+        Results follow project_ids order; a project whose fetch failed gets its exception.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(project_id: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.get_tasks_by_project(project_id)
+
+        return await asyncio.gather(*(fetch(p) for p in project_ids), return_exceptions=True)
+
     async def create_time_entry_v2(
         self,
         date: str,
@@ -487,27 +529,21 @@ class RocketlaneClient:
         payload["user"] = {"userId": int(settings.rocketlane_user_id)}
 
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/time-entries"
-                log_request_details(self.logger, "POST", url, self.headers, payload)
-                self.logger.info(f"Creating time entry with payload: {json.dumps(payload, indent=2)}")
-
-                attempt = 0
-                while attempt <= self.max_retries:
-                    response = await client.post(url, headers=self.headers, json=payload)
-
-                    # Handle rate limiting
-                    if await self._handle_rate_limiting(response, attempt):
-                        attempt += 1
-                        continue
-
-                    break
+            url = f"{self.base_url}/time-entries"
+            log_request_details(self.logger, "POST", url, self.json_headers, payload)
+            # The full payload is only worth serializing for the debug log above
+            self.logger.info(f"Creating time entry: {minutes} minutes on {date}")
+
+            # Encoded once; retries resend the same bytes
+            response = await self._request(
+                "POST", url, headers=self.json_headers, content=orjson.dumps(payload)
+            )
 
-                log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
-                if response.status_code == 400:
-                    self.logger.error(f"400 Bad Request. Response body: {response.text}")
-                response.raise_for_status()
-                return response.json()
+            self._log_response(response)
+            if response.status_code == 400:
+                self.logger.error(f"400 Bad Request. Response body: {response.text}")
+            response.raise_for_status()
+            return parse_json(response)
 
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error creating time entry: {e}")
@@ -556,24 +592,17 @@ class RocketlaneClient:
         payload["user"] = {"userId": int(settings.rocketlane_user_id)}
 
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/time-entries/{entry_id}"
-                log_request_details(self.logger, "PUT", url, self.headers, payload)
-
-                attempt = 0
-                while attempt <= self.max_retries:
-                    response = await client.put(url, headers=self.headers, json=payload)
+            url = f"{self.base_url}/time-entries/{entry_id}"
+            log_request_details(self.logger, "PUT", url, self.json_headers, payload)
 
-                    # Handle rate limiting
-                    if await self._handle_rate_limiting(response, attempt):
-                        attempt += 1
-                        continue
-
-                    break
+            # Encoded once; retries resend the same bytes
+            response = await self._request(
+                "PUT", url, headers=self.json_headers, content=orjson.dumps(payload)
+            )
 
-                log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
-                response.raise_for_status()
-                return response.json()
+            self._log_response(response)
+            response.raise_for_status()
+            return parse_json(response)
 
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error updating time entry: {e}")
@@ -585,23 +614,13 @@ class RocketlaneClient:
     async def delete_time_entry(self, entry_id: str) -> None:
         """Delete a time entry."""
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/time-entries/{entry_id}"
-                log_request_details(self.logger, "DELETE", url, self.headers, {})
+            url = f"{self.base_url}/time-entries/{entry_id}"
+            log_request_details(self.logger, "DELETE", url, self.headers, {})
 
-                attempt = 0
-                while attempt <= self.max_retries:
-                    response = await client.delete(url, headers=self.headers)
+            response = await self._request("DELETE", url)
 
-                    # Handle rate limiting
-                    if await self._handle_rate_limiting(response, attempt):
-                        attempt += 1
-                        continue
-
-                    break
-
-                log_response_details(self.logger, response.status_code, response.text[:500] if response.text else "")
-                response.raise_for_status()
+            self._log_response(response)
+            response.raise_for_status()
 
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error deleting time entry: {e}")
@@ -609,3 +628,36 @@ class RocketlaneClient:
         except Exception as e:
             self.logger.error(f"Unexpected error deleting time entry: {e}")
             raise
+
+
+@lru_cache(maxsize=1)
+def get_rocketlane_client() -> RocketlaneClient:
+    """Get the shared Rocketlane client built from the current settings.
+
+    Call ``get_rocketlane_client.cache_clear()`` after the API key or base URL changes.
+    """
+    return RocketlaneClient()
+
+
+@lru_cache(maxsize=1)
+def get_rocketlane_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP/2 client shared by Rocketlane API callers.
+
+    Reusing one client keeps the TLS connection to the API alive across requests.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.rocketlane_max_keepalive,
+            max_connections=100,
+            keepalive_expiry=settings.rocketlane_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
+
+
+async def close_rocketlane_http_client() -> None:
+    """Close the shared Rocketlane HTTP client if it was ever created"""
+    if get_rocketlane_http_client.cache_info().currsize:
+        await get_rocketlane_http_client().aclose()
+        get_rocketlane_http_client.cache_clear()
@@ -1,32 +1,48 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from ..core.config import settings
 from ..core.llm import get_llm_provider
 from ..prompts import PromptManager
-from ..services.rocketlane import RocketlaneClient
+from ..services.rocketlane import get_rocketlane_client
 
 
 class SummarizationService:
     """Service for summarizing tasks and projects"""
 
     def __init__(self):
-        self.rocketlane_client = RocketlaneClient()
+        self.rocketlane_client = get_rocketlane_client()
         self.prompt_manager = PromptManager()
+        # Project name and outstanding tasks already loaded by this service, keyed by project id
+        self._project_tasks: dict[str, tuple[str, list[dict[str, Any]]]] = {}
 
-    async def summarize_project_tasks(self, project_id: str) -> dict[str, Any]:
-        """Summarize outstanding tasks for a project"""
-        # Get project details
-        project = await self.rocketlane_client.get_project(project_id)
-        project_name = project.get("projectName", project.get("name", "Unknown Project"))
+    async def _get_project_tasks(self, project_id: str) -> tuple[str, list[dict[str, Any]]]:
+        """Get the project name and the configured user's outstanding tasks.
+
+        The project and its tasks are fetched concurrently, and the result is reused
+        so the streaming endpoint doesn't fetch them again after sending metadata.
+        """
+        if project_id in self._project_tasks:
+            return self._project_tasks[project_id]
 
-        # Get outstanding tasks (not done) for the configured user
         user_id = settings.rocketlane_user_id if settings.rocketlane_user_id else None
-        tasks = await self.rocketlane_client.get_project_tasks(
-            project_id=project_id,
-            status="not_done",  # Adjust based on actual Rocketlane API
-            user_id=user_id,
+        project, tasks = await asyncio.gather(
+            self.rocketlane_client.get_project(project_id),
+            self.rocketlane_client.get_project_tasks(
+                project_id=project_id,
+                status="not_done",  # Adjust based on actual Rocketlane API
+                user_id=user_id,
+            ),
         )
+        project_name = project.get("projectName", project.get("name", "Unknown Project"))
+
+        self._project_tasks[project_id] = (project_name, tasks)
+        return project_name, tasks
+
+    async def summarize_project_tasks(self, project_id: str) -> dict[str, Any]:
+        """Summarize outstanding tasks for a project"""
+        project_name, tasks = await self._get_project_tasks(project_id)
 
         if not tasks:
             return {
@@ -57,16 +73,7 @@ class SummarizationService:
 
     async def get_project_metadata(self, project_id: str) -> dict[str, Any]:
         """Get project metadata for streaming response"""
-        project = await self.rocketlane_client.get_project(project_id)
-        project_name = project.get("projectName", project.get("name", "Unknown Project"))
-
-        # Get outstanding tasks for the configured user
-        user_id = settings.rocketlane_user_id if settings.rocketlane_user_id else None
-        tasks = await self.rocketlane_client.get_project_tasks(
-            project_id=project_id,
-            status="not_done",
-            user_id=user_id,
-        )
+        project_name, tasks = await self._get_project_tasks(project_id)
 
         return {
             "project_id": project_id,
@@ -76,17 +83,7 @@ class SummarizationService:
 
     async def summarize_project_tasks_stream(self, project_id: str) -> AsyncGenerator[str]:
         """Stream summarization of outstanding tasks for a project"""
-        # Get project details
-        project = await self.rocketlane_client.get_project(project_id)
-        project_name = project.get("projectName", project.get("name", "Unknown Project"))
-
-        # Get outstanding tasks for the configured user
-        user_id = settings.rocketlane_user_id if settings.rocketlane_user_id else None
-        tasks = await self.rocketlane_client.get_project_tasks(
-            project_id=project_id,
-            status="not_done",
-            user_id=user_id,
-        )
+        project_name, tasks = await self._get_project_tasks(project_id)
 
         if not tasks:
             yield "No outstanding tasks found for this project."
@@ -8,7 +8,7 @@ from typing import Any
 from ..core.cache import BaseCache, CacheConfig
 from ..core.config import settings
 from .project_cache_v2 import ProjectCacheService
-from .rocketlane import RocketlaneClient
+from .rocketlane import RocketlaneClient, get_rocketlane_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +31,10 @@ class TasksCache(BaseCache[dict[str, Any]]):
         self.last_update: datetime | None = None
         self.is_updating = False
         self.cache_ttl = timedelta(minutes=5)  # Cache validity period
-        self.client = None
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     def is_cache_fresh(self) -> bool:
         """Check if cache is still fresh."""
@@ -188,7 +185,7 @@ class TasksCache(BaseCache[dict[str, Any]]):
         logger.info(f"Updating tasks cache for user {settings.rocketlane_user_id}")
 
         try:
-            client = RocketlaneClient(settings.rocketlane_api_key, settings.rocketlane_api_base_url)
+            client = self._get_client()
             project_cache = ProjectCacheService()
 
             # Get all projects the user is a member of
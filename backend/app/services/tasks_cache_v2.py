@@ -7,7 +7,7 @@ from typing import Any
 from ..core.cache import BaseCache, CacheConfig
 from ..core.config import settings
 from .project_cache_v2 import ProjectCacheService
-from .rocketlane import RocketlaneClient
+from .rocketlane import RocketlaneClient, get_rocketlane_client
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +24,10 @@ class TasksCacheV2(BaseCache[dict[str, Any]]):
             enable_background_refresh=True
         )
         super().__init__(config, "tasks")
-        self.client = None
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     async def fetch_data(self) -> dict[str, Any]:
         """Fetch tasks data from Rocketlane API."""
@@ -53,16 +50,17 @@ class TasksCacheV2(BaseCache[dict[str, Any]]):
             # This is needed for timesheets - users can log time on any task in their projects
             all_tasks = []
 
-            for project in user_projects:
-                project_id = project.get("projectId")
-                if project_id:
-                    try:
-                        # Get all tasks for this project (not filtered by assignee)
-                        project_tasks = await client.get_tasks_by_project(project_id)
-                        all_tasks.extend(project_tasks)
-                        logger.info(f"Fetched {len(project_tasks)} tasks for project {project_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch tasks for project {project_id}: {e}")
+            # Projects are fetched concurrently (not filtered by assignee)
+            project_ids = [p["projectId"] for p in user_projects if p.get("projectId")]
+            results = await client.get_tasks_by_projects(project_ids)
+            for project_id, project_tasks in zip(project_ids, results, strict=True):
+                if isinstance(project_tasks, BaseException):
+                    logger.warning(
+                        f"Failed to fetch tasks for project {project_id}: {project_tasks}"
+                    )
+                    continue
+                all_tasks.extend(project_tasks)
+                logger.info(f"Fetched {len(project_tasks)} tasks for project {project_id}")
 
             logger.info(f"Fetched total of {len(all_tasks)} tasks from {len(user_projects)} projects")
 
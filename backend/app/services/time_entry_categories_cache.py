@@ -6,7 +6,7 @@ from typing import Any
 
 from ..core.cache import BaseCache, CacheConfig
 from ..core.config import settings
-from .rocketlane import RocketlaneClient
+from .rocketlane import RocketlaneClient, get_rocketlane_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +23,10 @@ class TimeEntryCategoriesCache(BaseCache[list[dict[str, Any]]]):
             enable_background_refresh=True
         )
         super().__init__(config, "time_entry_categories")
-        self.client = None
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     async def fetch_data(self) -> list[dict[str, Any]]:
         """Fetch time entry categories from Rocketlane API."""
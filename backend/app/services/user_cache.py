@@ -3,12 +3,43 @@ User caching service with retry logic and resilient fetching.
 """
 
 import asyncio
+import gzip
 from typing import Any
 
+import brotli
 import httpx
+import orjson
 
 from ..core.cache import BaseCache, CacheConfig
-from .rocketlane import RocketlaneClient
+from .rocketlane import RocketlaneClient, get_rocketlane_client
+
+# Response encodings we can produce, in order of preference
+_COMPRESSORS = {
+    "br": lambda body: brotli.compress(body, quality=5),
+    "gzip": lambda body: gzip.compress(body, compresslevel=5),
+}
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse an Accept-Encoding header into the set of encodings with a non-zero q-value"""
+    qvalues: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+
+    wildcard = qvalues.get("*", 0.0)
+    return {coding for coding in _COMPRESSORS if qvalues.get(coding, wildcard) > 0}
 
 
 class UserCacheService(BaseCache[list[dict[str, Any]]]):
@@ -23,14 +54,16 @@ class UserCacheService(BaseCache[list[dict[str, Any]]]):
             enable_background_refresh=True
         )
         super().__init__(config, "users")
-        self.client = None
+        # Last formatted user list served by the API, used as an error fallback
+        self.last_good: list[dict[str, Any]] | None = None
+        # Cache generation (entry timestamp) that last_good and the encoded bodies belong to
+        self._formatted_generation: float | None = None
+        self._encoded: dict[str, bytes] = {}
         self.fetch_timeout = 15.0  # Timeout for user fetches
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     async def _fetch_users_with_retry(self) -> list[dict[str, Any]]:
         """Fetch all users with retry logic"""
@@ -113,6 +146,80 @@ class UserCacheService(BaseCache[list[dict[str, Any]]]):
             force_refresh=force_refresh
         ) or []
 
+    def _get_generation(self) -> float | None:
+        """Timestamp of the current user cache entry, used to detect cache updates"""
+        entry = self._memory_cache.get("all_users")
+        return entry.timestamp if entry else None
+
+    @staticmethod
+    def format_users(users: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Transform raw Rocketlane users for the API, sorted by full name"""
+        formatted_users = []
+        for user in users:
+            user_id = user.get("userId")
+            email = user.get("email") or user.get("emailId")  # Handle both 'email' and 'emailId'
+            if not user_id or not email:
+                continue
+            first_name = user.get("firstName", "")
+            last_name = user.get("lastName", "")
+            formatted_users.append(
+                {
+                    "userId": user_id,
+                    "emailId": email,
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "fullName": f"{first_name} {last_name}".strip() or email.split("@", 1)[0],
+                }
+            )
+
+        # Sort users alphabetically by full name
+        formatted_users.sort(key=lambda u: u["fullName"].lower())
+        return formatted_users
+
+    async def get_formatted_users(self, force_refresh: bool = False) -> list[dict[str, Any]]:
+        """Get formatted users, re-formatting only when the underlying cache entry changes"""
+        users = await self.get_all_users(force_refresh)
+        generation = self._get_generation()
+
+        if self.last_good is None or generation is None or generation != self._formatted_generation:
+            self.last_good = self.format_users(users)
+            self._formatted_generation = generation
+            self._encoded = {}
+
+        return self.last_good
+
+    def get_etag(self) -> str | None:
+        """Weak ETag for the current formatted user list"""
+        if self._formatted_generation is None:
+            return None
+        return f'W/"{self._formatted_generation}"'
+
+    def get_encoded(self, accept_encoding: str) -> tuple[bytes, str | None]:
+        """Get the serialized formatted users, compressed if the client accepts it.
+
+        Prefers brotli over gzip. Bodies are built once per cache generation and
+        reused until the cache changes.
+
+        Returns:
+            Tuple of (body, content encoding or None)
+        """
+        plain = self._encoded.get("identity")
+        if plain is None:
+            plain = orjson.dumps(self.last_good or [])
+            self._encoded["identity"] = plain
+
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding, compress in _COMPRESSORS.items():
+            if encoding not in accepted:
+                continue
+            body = self._encoded.get(encoding)
+            if body is None:
+                body = compress(plain)
+                self._encoded[encoding] = body
+            return body, encoding
+
+        return plain, None
+
     async def get_user_by_id(
         self,
         user_id: int,
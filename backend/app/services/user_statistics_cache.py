@@ -8,7 +8,7 @@ from typing import Any
 from ..core.cache import BaseCache, CacheConfig
 from ..core.config import settings
 from .project_cache_v2 import ProjectCacheService
-from .rocketlane import RocketlaneClient
+from .rocketlane import RocketlaneClient, get_rocketlane_client
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +25,10 @@ class UserStatisticsCache(BaseCache[dict[str, Any]]):
             enable_background_refresh=True
         )
         super().__init__(config, "user_statistics")
-        self.client = None
 
     def _get_client(self) -> RocketlaneClient:
-        """Get or create Rocketlane client"""
-        if not self.client:
-            self.client = RocketlaneClient()
-        return self.client
+        """Get the shared Rocketlane client"""
+        return get_rocketlane_client()
 
     async def fetch_data(self) -> dict[str, Any]:
         """Fetch user statistics from Rocketlane API."""
@@ -44,11 +41,20 @@ class UserStatisticsCache(BaseCache[dict[str, Any]]):
         try:
             client = self._get_client()
 
-            # Fetch user info
-            user = await client.get_user(settings.rocketlane_user_id)
+            today = datetime.now(UTC).date()
+            start_of_week = today - timedelta(days=today.weekday())
 
-            # Fetch only tasks assigned to the user (MUCH more efficient)
-            all_tasks = await client.get_tasks(user_id=settings.rocketlane_user_id, limit=500)
+            # User info, the user's tasks (only those assigned to them) and this week's time
+            # entries are independent, so fetch them concurrently over the shared connection
+            user, all_tasks, time_entries = await asyncio.gather(
+                client.get_user(settings.rocketlane_user_id),
+                client.get_tasks(user_id=settings.rocketlane_user_id, limit=500),
+                client.get_time_entries(
+                    user_id=settings.rocketlane_user_id,
+                    date_from=start_of_week.isoformat(),
+                    date_to=today.isoformat(),
+                ),
+            )
             logger.info(f"Fetched {len(all_tasks)} tasks for user {settings.rocketlane_user_id}")
 
             # Debug logging for task analysis
@@ -62,7 +68,6 @@ class UserStatisticsCache(BaseCache[dict[str, Any]]):
             due_this_week = []
             user_projects = set()
 
-            today = datetime.now(UTC).date()
             week_end = today + timedelta(days=7)
 
             for task in all_tasks:
@@ -97,13 +102,6 @@ class UserStatisticsCache(BaseCache[dict[str, Any]]):
                             pass
 
             # Calculate time logged this week
-            start_of_week = today - timedelta(days=today.weekday())
-            time_entries = await client.get_time_entries(
-                user_id=settings.rocketlane_user_id,
-                date_from=start_of_week.strftime("%Y-%m-%d"),
-                date_to=today.strftime("%Y-%m-%d")
-            )
-
             total_minutes_this_week = 0
             if time_entries:
                 logger.debug(f"Time entries this week: {len(time_entries)}")
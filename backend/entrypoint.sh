@@ -24,7 +24,7 @@ fi
 # Check if debug mode is enabled
 if [ "$DEBUG_MODE" = "true" ]; then
     echo "Debug mode enabled - starting with verbose logging"
-    exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload --log-level debug
+    exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --reload --log-level debug
 else
     # Execute the main command
     exec "$@"
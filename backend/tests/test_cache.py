@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.cache import BaseCache, CacheConfig, CacheEntry
+
+
+class DummyCache(BaseCache[str]):
+    """Minimal concrete cache for exercising BaseCache behaviour"""
+
+    async def warm_cache(self):
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    config = CacheConfig(cache_dir=str(tmp_path), memory_cache_size=2)
+    return DummyCache(config, "dummy")
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used(cache):
+    """Memory cache is bounded by memory_cache_size and evicts in LRU order"""
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert await cache.get("a") == "1"
+    await cache.set("c", "3")
+
+    assert list(cache._memory_cache) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(cache):
+    """Concurrent cache misses for the same key trigger a single fetch"""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "fresh"
+
+    results = await asyncio.gather(*(cache.get("k", fetch_func=fetch) for _ in range(5)))
+
+    assert results == ["fresh"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_hits_schedule_one_background_refresh(cache):
+    """Repeated stale hits share a single background refresh for the key"""
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "fresh"
+
+    # Entry is valid but already past the stale threshold
+    await cache.set("k", "old", ttl=3600)
+    cache._memory_cache["k"].timestamp -= 3000
+
+    for _ in range(5):
+        assert await cache.get("k", fetch_func=fetch) == "old"
+    await asyncio.gather(*cache._refresh_tasks.values())
+
+    assert calls == 1
+    assert await cache.get("k") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_under_eager_task_factory_does_not_block_later_refreshes(cache):
+    """A refresh that fails before its first await still frees the key for the next stale hit"""
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("API down")
+
+    await cache.set("k", "old", ttl=3600)
+    cache._memory_cache["k"].timestamp -= 3000
+
+    try:
+        assert await cache.get("k", fetch_func=fetch) == "old"
+        await asyncio.sleep(0)  # let the done callback run
+        assert await cache.get("k", fetch_func=fetch) == "old"
+        await asyncio.sleep(0)
+    finally:
+        asyncio.get_running_loop().set_task_factory(None)
+
+    assert calls == 2
+    assert not cache._refresh_tasks
+
+
+@pytest.mark.asyncio
+async def test_reads_cache_file_created_by_another_process(cache):
+    """A cache file that appears after a miss is picked up on the next read"""
+    assert await cache.get("k") is None
+
+    # Another process writes the shared cache file
+    cache.cache_file.write_text(json.dumps({"k": CacheEntry("from-other").to_dict()}))
+
+    assert await cache.get("k") == "from-other"
+
+
+@pytest.mark.asyncio
+async def test_failed_shared_fetch_is_logged_once(cache, caplog):
+    """A failing shared fetch raises for every waiter but is logged a single time"""
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("api down")
+
+    results = await asyncio.gather(
+        *(cache.get("k", fetch_func=fetch) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    errors = [r for r in caplog.records if r.levelname == "ERROR" and "api down" in r.message]
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_load_persisted_restores_entries_after_restart(cache, tmp_path):
+    """Entries written by a previous process are loaded into memory, stale ones as fallback"""
+    await cache.set("fresh", "1")
+    await cache.set("old", "2", ttl=1)
+    entry = cache._memory_cache["old"]
+    entry.expires_at = entry.timestamp - 1
+    await cache._write_cache_file(dict(cache._memory_cache))
+
+    restarted = DummyCache(CacheConfig(cache_dir=str(tmp_path)), "dummy")
+
+    assert await restarted.load_persisted() == 2
+    assert restarted._memory_cache["fresh"].data == "1"
+    assert restarted._memory_cache["old"].is_expired()
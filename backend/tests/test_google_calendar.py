@@ -0,0 +1,137 @@
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.models.google_calendar import (
+    GoogleCalendarAuth,
+    GoogleCalendarEvent,
+    GoogleCalendarEventIndex,
+)
+from app.services import google_calendar
+from app.services.google_calendar import GoogleCalendarService
+
+
+def _event(event_id, start, hours=1):
+    return GoogleCalendarEvent(id=event_id, start=start, end=start + timedelta(hours=hours))
+
+
+def test_event_index_finds_overlapping_events_in_start_order():
+    """Window lookups return events overlapping the window, including all-day ones"""
+    day = datetime(2025, 3, 3, tzinfo=UTC)
+    events = [
+        _event("late", day + timedelta(hours=15)),
+        _event("early", day + timedelta(hours=8)),
+        _event("long", day + timedelta(hours=6), hours=5),
+        # All-day events are stored as naive midnights
+        GoogleCalendarEvent(
+            id="all-day", start=datetime(2025, 3, 3), end=datetime(2025, 3, 4), is_all_day=True
+        ),
+        _event("next-day", day + timedelta(days=1, hours=9)),
+    ]
+
+    index = GoogleCalendarEventIndex.build(events)
+    window = index.overlapping(day + timedelta(hours=9), day + timedelta(hours=12))
+
+    assert [events[i].id for i in window] == ["all-day", "long"]
+
+
+@pytest.mark.asyncio
+async def test_sync_reuses_unchanged_events(tmp_path, monkeypatch):
+    """Events whose updated timestamp didn't change keep their existing model instance"""
+    items = [
+        {
+            "id": "a",
+            "start": {"dateTime": "2025-03-03T09:00:00+00:00"},
+            "end": {"dateTime": "2025-03-03T10:00:00+00:00"},
+            "updated": "2025-03-01T12:00:00Z",
+        },
+        {
+            "id": "b",
+            "start": {"date": "2025-03-04"},
+            "end": {"date": "2025-03-05"},
+            "updated": "2025-03-01T12:00:00Z",
+        },
+    ]
+
+    class FakeCalendar:
+        def events(self):
+            return self
+
+        def list(self, **kwargs):
+            return self
+
+        def execute(self):
+            return {"items": items}
+
+    monkeypatch.setattr(GoogleCalendarService, "CACHE_FILE", tmp_path / "gcal.json")
+    monkeypatch.setattr(google_calendar, "build", lambda *args, **kwargs: FakeCalendar())
+    service = GoogleCalendarService()
+    monkeypatch.setattr(service, "_get_credentials", lambda: object())
+
+    assert await service.sync_events()
+    first_a, first_b = service.get_cached_events()
+
+    items[1] = {**items[1], "summary": "Offsite", "updated": "2025-03-02T08:00:00Z"}
+    assert await service.sync_events()
+    second_a, second_b = service.get_cached_events()
+
+    assert second_a is first_a
+    assert second_b is not first_b
+    assert second_b.summary == "Offsite"
+    assert second_b.is_all_day
+
+
+@pytest.mark.asyncio
+async def test_ensure_fresh_shares_one_background_refresh(tmp_path, monkeypatch):
+    """Concurrent callers near token expiry trigger a single refresh and store its token"""
+    monkeypatch.setattr(GoogleCalendarService, "CACHE_FILE", tmp_path / "gcal.json")
+    service = GoogleCalendarService()
+    service.cache.auth = GoogleCalendarAuth(
+        access_token="old", refresh_token="refresh", token_uri="uri", client_id="id",
+        client_secret="secret", scopes=[],
+    )
+    expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(minutes=5, seconds=30)
+    refreshes = []
+
+    class FakeCredentials:
+        token = "old"
+        refresh_token = "refresh"
+
+        def __init__(self):
+            self.expiry = expiry
+
+        def refresh(self, request):
+            refreshes.append(request)
+            time.sleep(0.01)
+            self.token = "new"
+            self.expiry = expiry + timedelta(hours=1)
+
+    service._credentials = FakeCredentials()
+
+    await asyncio.gather(*(service.ensure_fresh() for _ in range(3)))
+
+    assert len(refreshes) == 1
+    assert service.cache.auth.access_token == "new"
+    assert service._dirty
+
+
+def test_cache_round_trips_through_file(tmp_path, monkeypatch):
+    """A flushed cache loads back equal, with naive all-day and aware timed datetimes intact"""
+    monkeypatch.setattr(GoogleCalendarService, "CACHE_FILE", tmp_path / "gcal.json")
+    service = GoogleCalendarService()
+    day = datetime(2025, 3, 3, tzinfo=UTC)
+    service.cache.events = [
+        _event("timed", day + timedelta(hours=9)).model_copy(
+            update={"attendees": [{"email": "a@example.com"}], "updated": day}
+        ),
+        GoogleCalendarEvent(
+            id="all-day", start=datetime(2025, 3, 3), end=datetime(2025, 3, 4), is_all_day=True
+        ),
+    ]
+    service.cache.last_synced = day
+    service._mark_dirty()
+    service.flush()
+
+    assert GoogleCalendarService().cache == service.cache
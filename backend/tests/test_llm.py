@@ -0,0 +1,197 @@
+import asyncio
+
+import pytest
+
+from app.core.config_manager import get_settings
+from app.core.llm import base
+from app.core.llm.base import BaseLLMProvider
+
+
+class EchoProvider(BaseLLMProvider):
+    """Provider that counts calls instead of hitting an API"""
+
+    def __init__(self, model: str = "echo-1"):
+        super().__init__(api_key="test", model=model)
+        self.calls = 0
+
+    async def generate_completion(
+        self, prompt, system_prompt=None, temperature=0.7, max_tokens=None, model=None
+    ):
+        return await self.generate_chat_completion(
+            [{"role": "user", "content": prompt}], temperature, max_tokens, model
+        )
+
+    async def generate_chat_completion(
+        self, messages, temperature=0.7, max_tokens=None, model=None
+    ):
+        async def fetch():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return f"reply {self.calls}"
+
+        return await self._cached_completion(messages, temperature, max_tokens, model, fetch)
+
+    async def stream_completion(
+        self, prompt, system_prompt=None, temperature=0.7, max_tokens=None, model=None
+    ):
+        yield await self.generate_completion(prompt, system_prompt, temperature, max_tokens)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    BaseLLMProvider._response_cache.clear()
+    yield
+    BaseLLMProvider._response_cache.clear()
+    BaseLLMProvider._semantic_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_deterministic_responses_are_cached():
+    """Identical temperature-0 requests are answered from the response cache"""
+    provider = EchoProvider()
+
+    first = await provider.generate_completion("hello", temperature=0.0)
+    second = await provider.generate_completion("hello", temperature=0.0)
+    other_model = await EchoProvider(model="echo-2").generate_completion("hello", temperature=0.0)
+
+    assert first == second == "reply 1"
+    assert provider.calls == 1
+    assert other_model == "reply 1"  # different model, separate entry and fresh call
+
+
+@pytest.mark.asyncio
+async def test_sampled_responses_bypass_cache():
+    """Requests with temperature > 0 always reach the provider by default"""
+    provider = EchoProvider()
+
+    await provider.generate_completion("hello", temperature=0.7)
+    await provider.generate_completion("hello", temperature=0.7)
+
+    assert provider.calls == 2
+    assert not BaseLLMProvider._response_cache
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_serves_near_duplicate_prompts(monkeypatch):
+    """Reworded prompts with near-identical embeddings reuse the earlier response"""
+    monkeypatch.setattr(get_settings(), "semantic_cache_enabled", True)
+    vectors = {
+        "summarize the task": [1.0, 0.0],
+        "please summarize the task": [0.99, 0.05],
+        "list overdue tasks": [0.0, 1.0],
+        "summarize task for bob@example.com": [1.0, 0.0],
+    }
+    provider = EchoProvider()
+
+    async def embed(text):
+        return vectors[text]
+
+    monkeypatch.setattr(provider, "embed", embed)
+
+    first = await provider.generate_completion("summarize the task", temperature=0.0)
+    reworded = await provider.generate_completion("please summarize the task", temperature=0.0)
+    unrelated = await provider.generate_completion("list overdue tasks", temperature=0.0)
+    with_pii = await provider.generate_completion(
+        "summarize task for bob@example.com", temperature=0.0
+    )
+
+    assert first == reworded == "reply 1"
+    assert unrelated == "reply 2"
+    assert with_pii == "reply 3"  # prompts with PII never use the semantic cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """Concurrent identical requests wait on a single in-flight API call"""
+    provider = EchoProvider()
+
+    results = await asyncio.gather(
+        *(provider.generate_completion("hello", temperature=0.0) for _ in range(5))
+    )
+
+    assert results == ["reply 1"] * 5
+    assert provider.calls == 1
+    assert not BaseLLMProvider._inflight
+
+
+@pytest.mark.asyncio
+async def test_generate_batch_bounds_concurrency():
+    """Batch generation keeps prompt order and never exceeds the concurrency limit"""
+    provider = EchoProvider()
+    provider._semaphore = asyncio.Semaphore(2)
+    running = peak = 0
+
+    async def generate_completion(
+        prompt, system_prompt=None, temperature=0.7, max_tokens=None, model=None
+    ):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return prompt.upper()
+
+    provider.generate_completion = generate_completion
+
+    assert await provider.generate_batch(["a", "b", "c", "d", "e"]) == ["A", "B", "C", "D", "E"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_restart(tmp_path, monkeypatch):
+    """Responses written to the SQLite cache are served after the memory cache is lost"""
+    disk_cache = base.SQLiteLLMCache(str(tmp_path / "llm.db"))
+    monkeypatch.setattr(base, "get_disk_cache", lambda: disk_cache)
+
+    provider = EchoProvider()
+    assert await provider.generate_completion("hello", temperature=0.0) == "reply 1"
+
+    # Simulate a restart
+    BaseLLMProvider._response_cache.clear()
+    restarted = EchoProvider()
+
+    assert await restarted.generate_completion("hello", temperature=0.0) == "reply 1"
+    assert restarted.calls == 0
+
+
+class CharEncoding:
+    """Tokenizer stand-in with one token per character"""
+
+    def encode(self, text, disallowed_special=()):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def test_truncate_keeps_head_and_tail(monkeypatch):
+    """Oversized prompts keep their start and end and drop the middle"""
+    monkeypatch.setattr(base, "_get_encoding", lambda model: CharEncoding())
+    provider = EchoProvider()
+
+    assert provider._truncate("short", max_tokens=100) == "short"
+    assert provider._truncate("a" * 10 + "b" * 80 + "c" * 10, max_tokens=20) == (
+        "a" * 10 + "\n...\n" + "c" * 10
+    )
+
+
+def test_match_choice_tolerates_formatting():
+    """Classification replies are matched to a choice despite case and punctuation"""
+    assert base._match_choice(' "Yes". ', ["yes", "no"]) == "yes"
+    assert base._match_choice("The answer is no", ["yes", "no"]) == "no"
+    with pytest.raises(ValueError):
+        base._match_choice("maybe", ["yes", "no"])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_provider_budget_is_spent():
+    """The bucket holds requests until the provider's rate-limit window resets"""
+    bucket = base.TokenBucket(capacity=5, refill_rate=1000)
+    await bucket.acquire()
+
+    bucket.update(remaining=0, reset_after=0.05)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await bucket.acquire()
+
+    assert loop.time() - started >= 0.04
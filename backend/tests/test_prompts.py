@@ -0,0 +1,37 @@
+from app.prompts import PromptManager
+from app.prompts.templates import task_summarization
+
+
+def test_task_summarization_prompt_lists_task_details():
+    """Each task is rendered with its description, due date, assignees, status and priority"""
+    tasks = [
+        {
+            "taskName": "Kickoff",
+            "description": "Plan the kickoff call",
+            "dueDate": "2025-01-10",
+            "assignees": {
+                "members": [
+                    {"firstName": "Amy", "lastName": "Brown"},
+                    {"firstName": "", "lastName": "", "emailId": "ops@example.com"},
+                ]
+            },
+            "status": {"label": "In progress"},
+            "priority": {"label": "High"},
+        },
+        {"title": "Follow up"},
+    ]
+
+    system_prompt, user_prompt = PromptManager.get_task_summarization_prompts("Acme", tasks)
+
+    assert system_prompt == task_summarization.TASK_SUMMARIZATION_SYSTEM
+    assert "Acme" in user_prompt
+    assert (
+        "- Kickoff: Plan the kickoff call\n"
+        "  Due: 2025-01-10\n"
+        "  Assigned to: Amy Brown, ops@example.com\n"
+        "  Status: In progress\n"
+        "  Priority: High\n"
+        "\n"
+        "- Follow up\n"
+        "\n"
+    ) in user_prompt
@@ -0,0 +1,117 @@
+from collections.abc import Callable
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.services import rocketlane
+from app.services.rocketlane import RocketlaneClient
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest_asyncio.fixture
+async def rocketlane_api(monkeypatch):
+    """Connect a RocketlaneClient to a mock API served by the given request handler.
+
+    The shared HTTP client is swapped for one over a MockTransport, closed at teardown.
+    """
+    http_clients: list[httpx.AsyncClient] = []
+
+    def connect(handler: Handler) -> RocketlaneClient:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_clients.append(http_client)
+        monkeypatch.setattr(rocketlane, "get_rocketlane_http_client", lambda: http_client)
+        return RocketlaneClient(api_key="test", base_url="https://rocketlane.test/api/1.0")
+
+    yield connect
+    for http_client in http_clients:
+        await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_single_record_lookups_are_cached_until_ttl(rocketlane_api):
+    """Repeated get_project calls within the TTL reuse the first response"""
+    requests_seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, json={"projectId": int(request.url.path.rsplit("/", 1)[1])})
+
+    client = rocketlane_api(handler)
+
+    assert await client.get_project("7") == {"projectId": 7}
+    assert await client.get_project("7") == {"projectId": 7}
+    assert await client.get_project("8") == {"projectId": 8}
+    assert len(requests_seen) == 2
+
+    client.response_ttl = 0
+    await client.get_project("9")
+    await client.get_project("9")
+    assert len(requests_seen) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_pushes_status_filter_and_follows_pages(rocketlane_api, monkeypatch):
+    """Status is filtered by the API across every page; assignees are still checked locally"""
+    tasks = [
+        {"taskId": 1, "status": {"value": 2}, "assignees": [{"userId": 5}]},
+        {"taskId": 2, "status": {"value": 2}, "assignees": [{"userId": 6}]},
+        {"taskId": 3, "status": 3, "assignees": [{"userId": 5}]},
+        {"taskId": 4, "status": {"value": 2}, "assignees": [{"userId": 5}]},
+    ]
+    seen: list[httpx.QueryParams] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        seen.append(params)
+        if "status.eq" in params and reject_status:
+            return httpx.Response(400, json={})
+        matching = [
+            t for t in tasks
+            if "status.eq" not in params or rocketlane._task_status(t) == int(params["status.eq"])
+        ]
+        # Two tasks per page, chained by the index of the next task
+        start = int(params.get("pageToken", 0))
+        next_token = str(start + 2) if start + 2 < len(matching) else None
+        return httpx.Response(200, json={
+            "data": matching[start:start + 2],
+            "pagination": {"hasMore": next_token is not None, "nextPageToken": next_token},
+        })
+
+    monkeypatch.setattr(RocketlaneClient, "_status_filter_works", True)
+    client = rocketlane_api(handler)
+
+    reject_status = False
+    in_progress = await client.get_tasks(project_id="1", status="in_progress", user_id="5")
+    assert [task["taskId"] for task in in_progress] == [1, 4]
+    assert [p.get("status.eq") for p in seen] == ["2", "2"]
+
+    # Once the API refuses the filter, status is filtered locally for the rest of the session
+    reject_status = True
+    seen.clear()
+    assert [task["taskId"] for task in await client.get_tasks(status="done")] == [3]
+    assert not RocketlaneClient._status_filter_works
+    await client.get_tasks(status="done")
+    assert sum("status.eq" in p for p in seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_retries_server_errors_only_for_idempotent_methods(rocketlane_api):
+    """A GET retries through 429 and 503; a POST that hit a 503 is not resent"""
+    statuses = {"GET": [429, 503, 200], "POST": [503, 200]}
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(statuses[request.method].pop(0), json={})
+
+    client = rocketlane_api(handler)
+    client.initial_retry_delay = 0
+
+    get = await client._request("GET", f"{client.base_url}/tasks/1")
+    post = await client._request("POST", f"{client.base_url}/time-entries", content=b"{}")
+
+    assert get.status_code == 200
+    assert post.status_code == 503
+    assert seen == ["GET", "GET", "GET", "POST"]
@@ -0,0 +1,116 @@
+import gzip
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import users
+from app.services.user_cache import UserCacheService
+
+RAW_USERS = [
+    {"userId": 2, "emailId": "zoe@example.com", "firstName": "Zoe", "lastName": "Adams"},
+    {"userId": 1, "email": "amy@example.com", "firstName": "Amy", "lastName": "Brown"},
+]
+
+
+@pytest.fixture
+def user_cache(tmp_path, monkeypatch):
+    """User cache backed by a temporary cache file and wired into the users route"""
+    service = UserCacheService()
+    service.cache_file = tmp_path / "users.json"
+    service.lock_file = tmp_path / "users.lock"
+    monkeypatch.setattr(users, "user_cache", service)
+    return service
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(users.router)
+    return TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_after_restart_serves_file_cache(user_cache, client, monkeypatch):
+    """A failed refresh with nothing formatted in-process still serves users from disk"""
+    await user_cache.set("all_users", RAW_USERS)
+
+    # Simulate a restart: nothing in memory, API unavailable
+    user_cache._memory_cache.clear()
+
+    async def api_down():
+        raise RuntimeError("api down")
+
+    monkeypatch.setattr(user_cache, "_fetch_users_with_retry", api_down)
+
+    response = client.get("/users/", params={"force_refresh": True})
+
+    assert response.status_code == 200
+    assert [u["userId"] for u in response.json()] == [1, 2]
+
+
+def test_format_users_skips_incomplete_and_sorts_by_name():
+    """format_users drops records without id/email, handles emailId and sorts by name"""
+    raw = [
+        {"userId": 3, "emailId": "bob@example.com", "firstName": "Bob", "lastName": ""},
+        {"userId": None, "email": "noid@example.com", "firstName": "No", "lastName": "Id"},
+        {"userId": 4, "firstName": "No", "lastName": "Email"},
+        {"userId": 5, "emailId": "carol@example.com"},
+        {"userId": 6, "email": "alice@example.com", "firstName": "Alice", "lastName": "Z"},
+    ]
+
+    formatted = UserCacheService.format_users(raw)
+
+    assert [u["userId"] for u in formatted] == [6, 3, 5]
+    assert formatted[1]["emailId"] == "bob@example.com"
+    assert formatted[1]["fullName"] == "Bob"
+    # No name at all falls back to the local part of the email
+    assert formatted[2]["fullName"] == "carol"
+
+
+@pytest.mark.asyncio
+async def test_users_response_encoding_and_etag(user_cache, client):
+    """Users are served compressed on request and revalidate with If-None-Match"""
+    await user_cache.set("all_users", RAW_USERS)
+
+    plain = client.get("/users/", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    etag = plain.headers["etag"]
+
+    gzipped = client.get("/users/", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.json() == plain.json()
+
+    body, encoding = user_cache.get_encoded("br;q=0, gzip;q=0.5")
+    assert encoding == "gzip"
+    assert orjson.loads(gzip.decompress(body)) == plain.json()
+    assert user_cache.get_encoded("gzip;q=0")[1] is None
+    assert user_cache.get_encoded("br, gzip")[1] == "br"
+
+    not_modified = client.get("/users/", headers={"If-None-Match": f'"other", {etag}'})
+    assert not_modified.status_code == 304
+    assert client.get("/users/", headers={"If-None-Match": "*"}).status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_formatted_users_rebuilt_when_cache_changes(user_cache):
+    """The formatted list, ETag and encoded bodies are rebuilt after the entry changes"""
+    await user_cache.set("all_users", RAW_USERS)
+    first = await user_cache.get_formatted_users()
+    first_etag = user_cache.get_etag()
+    first_body, _ = user_cache.get_encoded("")
+
+    # Same generation reuses the memoized results
+    assert await user_cache.get_formatted_users() is first
+    assert user_cache.get_encoded("")[0] is first_body
+
+    await user_cache.set("all_users", RAW_USERS[:1])
+    user_cache._memory_cache["all_users"].timestamp += 1
+
+    second = await user_cache.get_formatted_users()
+    assert [u["userId"] for u in second] == [2]
+    assert user_cache.get_etag() != first_etag
+    assert orjson.loads(user_cache.get_encoded("")[0]) == second